@@ -1,9 +1,23 @@
+import bisect
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def bubble_sort(lst):
     n = len(lst)
     for i in range(n):
         swapped = False
         for j in range(n - 1 - i):
-            if lst[j] < lst[j + 1]:
+            if lst[j] > lst[j + 1]:
                 lst[j], lst[j + 1] = lst[j + 1], lst[j]
                 swapped = True
         if not swapped:
@@ -19,12 +33,13 @@ def selection_sort(lst):
         if smallest != i:
             lst[smallest], lst[i] = lst[i], lst[smallest]
 
-def insertion_sort(lst):
-    n = len(lst)
-    for i in range(1, n):
+def insertion_sort(lst, lo=0, hi=None):
+    # Sorts lst[lo..hi] inclusive; defaults to the whole list
+    hi = len(lst) - 1 if hi is None else hi
+    for i in range(lo + 1, hi + 1):
         temp = lst[i]
         j = i - 1
-        while j >= 0 and lst[j] > temp:
+        while j >= lo and lst[j] > temp:
             lst[j + 1] = lst[j]
             j -= 1
         lst[j + 1] = temp
@@ -41,93 +56,858 @@ def merge(lst, left_half, right_half):
             j += 1
         k += 1
 
-        while i < n1:
-            lst[k] = lst[i]
-            i += 1
-            k += 1
+    while i < n1:
+        lst[k] = left_half[i]
+        i += 1
+        k += 1
 
-        while j < n2:
-            lst[k] = lst[j]
-            j += 1
-            k += 1
+    while j < n2:
+        lst[k] = right_half[j]
+        j += 1
+        k += 1
 
     return lst
 
-def merge_sort(lst):
-    start, end = 0, len(lst) - 1
-    while start < end:
-        mid = (start + end) // 2
-        left_half = merge_sort(lst[:mid])
-        right_half = merge_sort(lst[mid:])
-        merge(lst, left_half, right_half)
-    return lst
+MIN_RUN = 32
 
-def partition(lst):
+def merge_sort(lst, key=None):
+    # Stable, bottom-up natural merge sort. Existing ascending (or strictly descending) runs
+    # are found first, short runs are padded to MIN_RUN with insertion sort, then runs are
+    # merged pairwise, ping-ponging between lst and one scratch buffer. Sorted input is O(n).
     n = len(lst)
-    pivot = 0
-    i, j = 1, n - 1
-    while True:
-        while i <= j and lst[i] <= lst[pivot]:
+    if n < 2:
+        return lst
+    # With a key, keys are sorted and the values are moved alongside them
+    keys = lst if key is None else [key(x) for x in lst]
+    vals = None if key is None else lst
+    runs = _find_runs(keys, vals, n)
+
+    src_k, dst_k = keys, [None] * n
+    src_v, dst_v = vals, (None if vals is None else [None] * n)
+    while len(runs) > 2:
+        merged_runs = [0]
+        for r in range(0, len(runs) - 1, 2):
+            lo = runs[r]
+            if r + 2 < len(runs):
+                hi = runs[r + 2]
+                _merge_runs(src_k, dst_k, src_v, dst_v, lo, runs[r + 1], hi)
+            else:
+                hi = runs[r + 1]
+                dst_k[lo:hi] = src_k[lo:hi]
+                if src_v is not None:
+                    dst_v[lo:hi] = src_v[lo:hi]
+            merged_runs.append(hi)
+        runs = merged_runs
+        src_k, dst_k = dst_k, src_k
+        src_v, dst_v = dst_v, src_v
+
+    if vals is None and src_k is not lst:
+        lst[:] = src_k
+    elif vals is not None and src_v is not lst:
+        lst[:] = src_v
+    return lst
+
+def _find_runs(keys, vals, n):
+    runs = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n and keys[hi] < keys[lo]:
+            # Only strictly descending runs are reversed, so equal keys keep their order
+            while hi < n and keys[hi] < keys[hi - 1]:
+                hi += 1
+            keys[lo:hi] = keys[lo:hi][::-1]
+            if vals is not None:
+                vals[lo:hi] = vals[lo:hi][::-1]
+        else:
+            while hi < n and not keys[hi] < keys[hi - 1]:
+                hi += 1
+
+        if hi - lo < MIN_RUN and hi < n:
+            end = min(lo + MIN_RUN, n)
+            _binary_insertion_sort(keys, vals, lo, hi, end)
+            hi = end
+        runs.append(hi)
+        lo = hi
+    return runs
+
+def _binary_insertion_sort(keys, vals, lo, start, hi):
+    # keys[lo:start] is already sorted; insert the rest after any equal keys
+    for i in range(start, hi):
+        k = keys[i]
+        pos = bisect.bisect_right(keys, k, lo, i)
+        if pos == i:
+            continue
+        keys[pos + 1:i + 1] = keys[pos:i]
+        keys[pos] = k
+        if vals is not None:
+            v = vals[i]
+            vals[pos + 1:i + 1] = vals[pos:i]
+            vals[pos] = v
+
+def _merge_runs(src, dst, src_vals, dst_vals, lo, mid, hi):
+    if not src[mid] < src[mid - 1]:
+        # Runs are already in order
+        dst[lo:hi] = src[lo:hi]
+        if src_vals is not None:
+            dst_vals[lo:hi] = src_vals[lo:hi]
+        return
+
+    i, j, k = lo, mid, lo
+    if src_vals is None:
+        while i < mid and j < hi:
+            if src[j] < src[i]:
+                dst[k] = src[j]
+                j += 1
+            else:
+                dst[k] = src[i]
+                i += 1
+            k += 1
+    else:
+        while i < mid and j < hi:
+            if src[j] < src[i]:
+                dst[k] = src[j]
+                dst_vals[k] = src_vals[j]
+                j += 1
+            else:
+                dst[k] = src[i]
+                dst_vals[k] = src_vals[i]
+                i += 1
+            k += 1
+        dst_vals[k:k + mid - i] = src_vals[i:mid]
+        dst_vals[k + mid - i:hi] = src_vals[j:hi]
+    dst[k:k + mid - i] = src[i:mid]
+    dst[k + mid - i:hi] = src[j:hi]
+
+INSERTION_SORT_THRESHOLD = 16
+NINTHER_THRESHOLD = 40
+
+def _median_of_three(lst, a, b, c):
+    if lst[a] < lst[b]:
+        if lst[b] < lst[c]:
+            return b
+        return c if lst[a] < lst[c] else a
+    if lst[a] < lst[c]:
+        return a
+    return c if lst[b] < lst[c] else b
+
+def choose_pivot(lst, lo, hi):
+    mid = (lo + hi) // 2
+    if hi - lo + 1 < NINTHER_THRESHOLD:
+        return _median_of_three(lst, lo, mid, hi)
+    # Tukey's ninther: median of the medians of three evenly spaced triples
+    step = (hi - lo + 1) // 8
+    return _median_of_three(
+        lst,
+        _median_of_three(lst, lo, lo + step, lo + 2 * step),
+        _median_of_three(lst, mid - step, mid, mid + step),
+        _median_of_three(lst, hi - 2 * step, hi - step, hi),
+    )
+
+def partition(lst, lo, hi):
+    # Three-way (Dutch flag) partition around a chosen pivot. Returns (lt, gt) with
+    # lst[lo..lt-1] < pivot, lst[lt..gt] == pivot and lst[gt+1..hi] > pivot.
+    pivot = lst[choose_pivot(lst, lo, hi)]
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        val = lst[i]
+        if val < pivot:
+            lst[lt], lst[i] = val, lst[lt]
+            lt += 1
             i += 1
-        while i <= j and lst[j] > lst[pivot]:
-            j -= 1
+        elif pivot < val:
+            lst[gt], lst[i] = val, lst[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
 
-        if j < i:
-            break
+def heap_sort(lst, lo=0, hi=None):
+    # In-place max-heap sort of lst[lo..hi] inclusive
+    hi = len(lst) - 1 if hi is None else hi
+    n = hi - lo + 1
+
+    def sift_down(i, size):
+        val = lst[lo + i]
+        child = 2 * i + 1
+        while child < size:
+            if child + 1 < size and lst[lo + child] < lst[lo + child + 1]:
+                child += 1
+            if not val < lst[lo + child]:
+                break
+            lst[lo + i] = lst[lo + child]
+            i = child
+            child = 2 * i + 1
+        lst[lo + i] = val
+
+    for i in range(n // 2 - 1, -1, -1):
+        sift_down(i, n)
+    for end in range(n - 1, 0, -1):
+        lst[lo], lst[lo + end] = lst[lo + end], lst[lo]
+        sift_down(0, end)
+
+def quick_sort(lst, lo=0, hi=None):
+    # In-place introsort of lst[lo..hi] inclusive: median-of-three / ninther pivots, three-way
+    # partitioning, insertion sort for small ranges and heapsort once recursion gets too deep.
+    hi = len(lst) - 1 if hi is None else hi
+    if hi > lo:
+        _intro_sort(lst, lo, hi, 2 * (hi - lo + 1).bit_length())
+
+def _intro_sort(lst, lo, hi, depth_limit):
+    while hi - lo + 1 > INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            heap_sort(lst, lo, hi)
+            return
+        depth_limit -= 1
+        lt, gt = partition(lst, lo, hi)
+        # Recurse into the smaller side and loop on the larger, bounding the stack at O(log n)
+        if lt - lo < hi - gt:
+            _intro_sort(lst, lo, lt - 1, depth_limit)
+            lo = gt + 1
         else:
-            lst[i], lst[j] = lst[j], lst[i]
-    lst[pivot], lst[j] = lst[j], lst[pivot]
+            _intro_sort(lst, gt + 1, hi, depth_limit)
+            hi = lt - 1
+    insertion_sort(lst, lo, hi)
+
+INTEGER_TYPECODES = frozenset("bBhHiIlLqQ")
+RADIX_BITS = 11
+
+def _is_integer_buffer(values):
+    if np is not None and isinstance(values, np.ndarray):
+        return values.dtype.kind in "iu"
+    return isinstance(values, array) and values.typecode in INTEGER_TYPECODES
+
+def _comparison_sort(values):
+    if np is not None and isinstance(values, np.ndarray):
+        return np.sort(values, kind="stable")
+    if isinstance(values, array):
+        return array(values.typecode, merge_sort(values.tolist()))
+    return merge_sort(list(values))
+
+def radix_sort(values, bits=RADIX_BITS):
+    # Stable LSD radix sort of an integer array or NumPy buffer, returning a new sorted buffer
+    # of the same type. Keys are offset by the minimum, so signed values need no special case
+    # and only as many bits-wide passes run as the value range needs. Anything else (floats,
+    # lists, objects) falls back to a comparison sort.
+    if not _is_integer_buffer(values):
+        return _comparison_sort(values)
+    is_numpy = np is not None and isinstance(values, np.ndarray)
+    if len(values) < 2:
+        return values.copy() if is_numpy else array(values.typecode, values)
+    if is_numpy:
+        return _radix_sort_numpy(values)
+
+    seq = values.tolist()
+    lo = min(seq)
+    span = max(seq) - lo
+    mask = (1 << bits) - 1
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(mask + 1)]
+        appends = [bucket.append for bucket in buckets]
+        for val in seq:
+            appends[((val - lo) >> shift) & mask](val)
+        seq = list(chain.from_iterable(buckets))
+        shift += bits
+    return array(values.typecode, seq)
+
+def _radix_sort_numpy(values):
+    # Byte-wide passes; a stable argsort of uint8 digits is itself a counting sort in NumPy
+    if values.dtype.kind == "i":
+        # Flipping the sign bit maps signed order onto unsigned order
+        keys = values.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+    else:
+        keys = values.astype(np.uint64)
+    keys -= keys.min()
+    span = int(keys.max())
+    order = np.arange(len(values))
+    shift = 0
+    while span >> shift:
+        digits = ((keys[order] >> np.uint64(shift)) & np.uint64(0xFF)).astype(np.uint8)
+        order = order[np.argsort(digits, kind="stable")]
+        shift += 8
+    return values[order]
 
-    return j
+def counting_sort(values, max_range=None):
+    # Counting sort of an integer array or NumPy buffer, O(n + range), returning a new sorted
+    # buffer of the same type. When the value range exceeds max_range (default max(2n, 65536))
+    # the count table would dominate, so it hands over to radix_sort instead. Non-integer
+    # input falls back to a comparison sort.
+    if not _is_integer_buffer(values):
+        return _comparison_sort(values)
+    n = len(values)
+    is_numpy = np is not None and isinstance(values, np.ndarray)
+    if n < 2:
+        return values.copy() if is_numpy else array(values.typecode, values)
+    lo, hi = (int(values.min()), int(values.max())) if is_numpy else (min(values), max(values))
+    span = hi - lo + 1
+    if span > (max_range or max(2 * n, 1 << 16)):
+        return radix_sort(values)
 
-def quick_sort(lst):
-    start, end = 0, len(lst) - 1
-    while start < end:
-        p = partition(lst)
-        quick_sort(lst[:p])
-        quick_sort(lst[p:])
+    if is_numpy:
+        # Widen signed types first so the offset cannot overflow a narrow dtype
+        offsets = values - values.min() if values.dtype.kind == "u" else values.astype(np.int64) - lo
+        counts = np.bincount(offsets.astype(np.intp), minlength=span)
+        return np.repeat(np.arange(lo, hi + 1), counts).astype(values.dtype)
+
+    counts = [0] * span
+    for val in values:
+        counts[val - lo] += 1
+    out = array(values.typecode)
+    for offset, count in enumerate(counts):
+        if count:
+            out.extend(array(values.typecode, (lo + offset,)) * count)
+    return out
 
 
 class MinHeap:
     def __init__(self):
         self.min_heap = []
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        # Bottom-up heapify: O(n) instead of n pushes at O(log n) each
+        heap = cls()
+        heap.min_heap = list(iterable)
+        heap.heapify()
+        return heap
+
+    def __len__(self):
+        return len(self.min_heap)
+
     def push(self, val):
         self.min_heap.append(val)
         self.percolate_up(len(self.min_heap) - 1)
 
     def percolate_up(self, i):
-        parent_i = (i - 1) // 2
-        if parent_i >= 0 and self.min_heap[i] < self.min_heap[parent_i]:
-            self.min_heap[i], self.min_heap[parent_i] = self.min_heap[parent_i], self.min_heap[i]
-            self.percolate_up(parent_i)
+        # Hole-based: shift parents down and write val once instead of swapping each level
+        heap = self.min_heap
+        val = heap[i]
+        while i > 0:
+            parent_i = (i - 1) // 2
+            parent = heap[parent_i]
+            if not val < parent:
+                break
+            heap[i] = parent
+            i = parent_i
+        heap[i] = val
 
     def pop(self):
         if len(self.min_heap) == 0:
             return None
-        if len(self.min_heap) == 1:
-            return self.min_heap.pop()
+        last = self.min_heap.pop()
+        if not self.min_heap:
+            return last
         min_val = self.min_heap[0]
-        self.min_heap[0] = self.min_heap.pop()
+        self.min_heap[0] = last
         self.percolate_down(0)
         return min_val
 
-    def percolate_down(self, i):
-        left_child = 2 * i + 1
-        right_child = 2 * i + 2
-        smallest = i
+    def pushpop(self, val):
+        # Push then pop, but returns val untouched when it is already the smallest
+        heap = self.min_heap
+        if heap and heap[0] < val:
+            val, heap[0] = heap[0], val
+            self.percolate_down(0)
+        return val
 
-        if left_child < len(self.min_heap) and self.min_heap[left_child] < self.min_heap[smallest]:
-            smallest = left_child
-        if right_child < len(self.min_heap) and self.min_heap[right_child] < self.min_heap[smallest]:
-            smallest = right_child
-        if smallest != i:
-            self.min_heap[i], self.min_heap[smallest] = self.min_heap[smallest], self.min_heap[i]
-            self.percolate_down(smallest)
+    def replace(self, val):
+        # Pop then push; the heap must not be empty
+        heap = self.min_heap
+        if not heap:
+            raise IndexError("replace on empty heap")
+        min_val = heap[0]
+        heap[0] = val
+        self.percolate_down(0)
+        return min_val
+
+    def percolate_down(self, i):
+        heap = self.min_heap
+        n = len(heap)
+        val = heap[i]
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and heap[right] < heap[child]:
+                child = right
+            if not heap[child] < val:
+                break
+            heap[i] = heap[child]
+            i = child
+            child = 2 * i + 1
+        heap[i] = val
 
     def heapify(self):
         for i in range((len(self.min_heap) // 2) - 1, -1, -1):
             self.percolate_down(i)
 
     def peek(self):
-        return self.min_heap[0] if self.min_heap else None
\ No newline at end of file
+        return self.min_heap[0] if self.min_heap else None
+
+
+class IndexedMinHeap:
+    # Min-heap of distinct items with an item -> position map, so an item's priority can be
+    # changed or the item removed in O(log n). Entries are (priority, seq, item); seq is the
+    # insertion order, which breaks ties stably and keeps items from ever being compared.
+
+    def __init__(self, key=None):
+        self.key = key
+        self.heap = []
+        self.positions = {}
+        self._seq = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def _priority(self, item, priority):
+        if priority is not None:
+            return priority
+        return self.key(item) if self.key else item
+
+    def push(self, item, priority=None):
+        if item in self.positions:
+            raise ValueError(f"{item!r} is already in the heap")
+        self.heap.append((self._priority(item, priority), self._seq, item))
+        self._seq += 1
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        if not self.heap:
+            return None
+        priority, _, item = self.heap[0]
+        self._remove_at(0)
+        return item, priority
+
+    def peek(self):
+        if not self.heap:
+            return None
+        priority, _, item = self.heap[0]
+        return item, priority
+
+    def get_priority(self, item):
+        return self.heap[self.positions[item]][0]
+
+    def decrease_key(self, item, priority):
+        i = self.positions[item]
+        old_priority, seq, _ = self.heap[i]
+        if old_priority < priority:
+            raise ValueError(f"new priority {priority!r} is greater than current {old_priority!r}")
+        self.heap[i] = (priority, seq, item)
+        self._sift_up(i)
+
+    def increase_key(self, item, priority):
+        i = self.positions[item]
+        old_priority, seq, _ = self.heap[i]
+        if priority < old_priority:
+            raise ValueError(f"new priority {priority!r} is less than current {old_priority!r}")
+        self.heap[i] = (priority, seq, item)
+        self._sift_down(i)
+
+    def update(self, item, priority=None):
+        # Push, decrease or increase, whichever applies
+        if item not in self.positions:
+            self.push(item, priority)
+            return
+        priority = self._priority(item, priority)
+        if priority < self.get_priority(item):
+            self.decrease_key(item, priority)
+        else:
+            self.increase_key(item, priority)
+
+    def remove(self, item):
+        i = self.positions[item]
+        priority = self.heap[i][0]
+        self._remove_at(i)
+        return priority
+
+    def _remove_at(self, i):
+        heap = self.heap
+        del self.positions[heap[i][2]]
+        last = heap.pop()
+        if i < len(heap):
+            heap[i] = last
+            self.positions[last[2]] = i
+            # The moved entry may belong above or below its new slot
+            self._sift_up(i)
+            self._sift_down(self.positions[last[2]])
+
+    def _sift_up(self, i):
+        heap, positions = self.heap, self.positions
+        entry = heap[i]
+        while i > 0:
+            parent_i = (i - 1) // 2
+            parent = heap[parent_i]
+            if not entry < parent:
+                break
+            heap[i] = parent
+            positions[parent[2]] = i
+            i = parent_i
+        heap[i] = entry
+        positions[entry[2]] = i
+
+    def _sift_down(self, i):
+        heap, positions = self.heap, self.positions
+        n = len(heap)
+        entry = heap[i]
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and heap[right] < heap[child]:
+                child = right
+            if not heap[child] < entry:
+                break
+            heap[i] = heap[child]
+            positions[heap[i][2]] = i
+            i = child
+            child = 2 * i + 1
+        heap[i] = entry
+        positions[entry[2]] = i
+
+
+BATCH_HEAPIFY_DIVISOR = 16
+
+class NumericMinHeap:
+    # MinHeap over plain numbers stored unboxed in one typed buffer: a NumPy array when NumPy
+    # is available, otherwise array(typecode). Capacity doubles when full, so a float64 heap
+    # costs 8 bytes per slot and at most 16 per element. Scalar sifts go through a
+    # memoryview, which reads and writes Python floats without creating NumPy scalars.
+
+    def __init__(self, capacity=16, typecode="d", use_numpy=None):
+        self.typecode = typecode
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy, which is not installed")
+        self.size = 0
+        self._buf = None
+        self._view = None
+        self._allocate(max(1, capacity))
+
+    @classmethod
+    def from_iterable(cls, values, typecode="d", use_numpy=None):
+        heap = cls(len(values) if hasattr(values, "__len__") else 16, typecode, use_numpy)
+        heap.push_many(values)
+        return heap
+
+    @property
+    def capacity(self):
+        return len(self._buf)
+
+    def __len__(self):
+        return self.size
+
+    def _allocate(self, capacity):
+        # The memoryview must be released before an array buffer can be resized
+        if self._view is not None:
+            self._view.release()
+        if self.use_numpy:
+            buf = np.empty(capacity, dtype=self.typecode)
+            if self._buf is not None:
+                buf[:self.size] = self._buf[:self.size]
+            self._buf = buf
+        elif self._buf is None:
+            self._buf = array(self.typecode, bytes(capacity * array(self.typecode).itemsize))
+        else:
+            self._buf.extend(array(self.typecode, bytes((capacity - len(self._buf)) * self._buf.itemsize)))
+        self._view = memoryview(self._buf)
+
+    def _reserve(self, needed):
+        if needed > self.capacity:
+            capacity = self.capacity
+            while capacity < needed:
+                capacity *= 2
+            self._allocate(capacity)
+
+    def push(self, val):
+        self._reserve(self.size + 1)
+        self._view[self.size] = val
+        self.size += 1
+        self.percolate_up(self.size - 1)
+
+    def push_many(self, values):
+        # One buffer copy for the whole batch, then either a sift per new value or, when the
+        # batch is large relative to the heap, a single heapify of everything
+        if self.use_numpy:
+            # np.asarray can't consume a generator; np.fromiter can, like array() does
+            if hasattr(values, "__len__"):
+                values = np.asarray(values, dtype=self.typecode)
+            else:
+                values = np.fromiter(values, dtype=self.typecode)
+        elif not (isinstance(values, array) and values.typecode == self.typecode):
+            values = array(self.typecode, values)
+        count = len(values)
+        if not count:
+            return
+        start = self.size
+        self._reserve(start + count)
+        if self.use_numpy:
+            self._buf[start:start + count] = values
+        else:
+            self._view[start:start + count] = values
+        self.size += count
+        if count >= start // BATCH_HEAPIFY_DIVISOR:
+            self.heapify()
+        else:
+            for i in range(start, self.size):
+                self.percolate_up(i)
+
+    def heapify(self):
+        # An ascending buffer satisfies the heap property, and sorting it in C beats an O(n)
+        # heapify made of Python-level sifts
+        n = self.size
+        if self.use_numpy:
+            self._buf[:n].sort()
+        else:
+            self._view[:n] = array(self.typecode, sorted(self._view[:n]))
+
+    def peek(self):
+        return self._view[0] if self.size else None
+
+    def pop(self):
+        if not self.size:
+            return None
+        view = self._view
+        min_val = view[0]
+        self.size -= 1
+        if self.size:
+            view[0] = view[self.size]
+            self.percolate_down(0)
+        return min_val
+
+    def pushpop(self, val):
+        view = self._view
+        if self.size and view[0] < val:
+            val, view[0] = view[0], val
+            self.percolate_down(0)
+        return val
+
+    def replace(self, val):
+        if not self.size:
+            raise IndexError("replace on empty heap")
+        min_val = self._view[0]
+        self._view[0] = val
+        self.percolate_down(0)
+        return min_val
+
+    def percolate_up(self, i):
+        view = self._view
+        val = view[i]
+        while i > 0:
+            parent_i = (i - 1) // 2
+            parent = view[parent_i]
+            if not val < parent:
+                break
+            view[i] = parent
+            i = parent_i
+        view[i] = val
+
+    def percolate_down(self, i):
+        view = self._view
+        n = self.size
+        val = view[i]
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and view[right] < view[child]:
+                child = right
+            if not view[child] < val:
+                break
+            view[i] = view[child]
+            i = child
+            child = 2 * i + 1
+        view[i] = val
+
+
+class _Reversed:
+    # Inverts ordering so MinHeap can act as a max-heap over arbitrary keys
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+def kway_merge(*iterables, key=None):
+    # Lazily merges sorted iterables into one sorted stream, holding one item per input in a
+    # MinHeap. Entries are (sort key, input index, item), so equal keys come out in input
+    # order and items are never compared directly.
+    iterators = [iter(it) for it in iterables]
+    heap = MinHeap()
+    for i, it in enumerate(iterators):
+        for val in it:
+            heap.push((key(val) if key else val, i, val))
+            break
+
+    while len(heap) > 1:
+        _, i, val = heap.peek()
+        yield val
+        for nxt in iterators[i]:
+            heap.replace((key(nxt) if key else nxt, i, nxt))
+            break
+        else:
+            heap.pop()
+    if len(heap):
+        # Only one input left, so the rest of it can be passed straight through
+        _, i, val = heap.pop()
+        yield val
+        yield from iterators[i]
+
+def nsmallest(n, iterable, key=None):
+    # Yields the n smallest items of a stream in ascending order, keeping at most n of them.
+    # Ties go to the earlier item. The kept items live in a max-heap of (reversed key, -seq,
+    # item) so the root is the one to evict; once the heap is full, an item that cannot beat
+    # the root's key is skipped without touching the heap. Output starts once the stream is
+    # exhausted.
+    if n <= 0:
+        return
+    heap = MinHeap()
+    worst = None
+    for seq, val in enumerate(iterable):
+        k = key(val) if key else val
+        if worst is not None:
+            if k < worst:
+                heap.replace((_Reversed(k), -seq, val))
+                worst = heap.peek()[0].key
+        else:
+            heap.push((_Reversed(k), -seq, val))
+            if len(heap) == n:
+                worst = heap.peek()[0].key
+    kept = [heap.pop()[2] for _ in range(len(heap))]
+    yield from reversed(kept)
+
+def nlargest(n, iterable, key=None):
+    # Mirror of nsmallest: yields the n largest items in descending order from a min-heap of
+    # (key, -seq, item), with ties going to the earlier item.
+    if n <= 0:
+        return
+    heap = MinHeap()
+    worst = None
+    for seq, val in enumerate(iterable):
+        k = key(val) if key else val
+        if worst is not None:
+            if worst < k:
+                heap.replace((k, -seq, val))
+                worst = heap.peek()[0]
+        else:
+            heap.push((k, -seq, val))
+            if len(heap) == n:
+                worst = heap.peek()[0]
+    kept = [heap.pop()[2] for _ in range(len(heap))]
+    yield from reversed(kept)
+
+def external_sort(input_path, output_path, key=None, max_memory_bytes=64 * 2**20, max_fan_in=64,
+                  buffer_size=2**20, tmp_dir=None):
+    # Sorts a file of newline-terminated records too large for memory. Chunks of about
+    # max_memory_bytes are sorted in memory and spilled as runs to temp files; runs are then
+    # k-way merged through a MinHeap, at most max_fan_in at a time, so the merge holds one
+    # record plus one buffer_size read buffer per open run. key receives each record as
+    # bytes including its trailing newline. The sort is stable.
+    runs = []
+    # Every temp file is registered here before anything is written to it, so the finally
+    # clause removes partial runs too when a spill or merge pass fails
+    temp_paths = []
+    try:
+        with open(input_path, "rb", buffering=buffer_size) as src:
+            chunk, chunk_bytes = [], 0
+            for record in src:
+                if not record.endswith(b"\n"):
+                    record += b"\n"
+                chunk.append(record)
+                # Rough in-memory footprint: payload plus bytes-object and list-slot overhead
+                chunk_bytes += len(record) + 41
+                if chunk_bytes >= max_memory_bytes:
+                    runs.append(_spill_run(chunk, key, buffer_size, tmp_dir, temp_paths))
+                    chunk, chunk_bytes = [], 0
+            if chunk or not runs:
+                runs.append(_spill_run(chunk, key, buffer_size, tmp_dir, temp_paths))
+
+        # Merge in passes until one pass can write the output directly
+        while len(runs) > max_fan_in:
+            merged_runs = []
+            for i in range(0, len(runs), max_fan_in):
+                group = runs[i:i + max_fan_in]
+                fd, path = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+                temp_paths.append(path)
+                with os.fdopen(fd, "wb", buffering=buffer_size) as dst:
+                    _merge_run_files(group, dst, key, buffer_size)
+                merged_runs.append(path)
+                for run in group:
+                    os.remove(run)
+            runs = merged_runs
+
+        with open(output_path, "wb", buffering=buffer_size) as dst:
+            _merge_run_files(runs, dst, key, buffer_size)
+    finally:
+        for path in temp_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+def _spill_run(chunk, key, buffer_size, tmp_dir, temp_paths):
+    chunk.sort(key=key)
+    fd, path = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+    temp_paths.append(path)
+    with os.fdopen(fd, "wb", buffering=buffer_size) as dst:
+        dst.writelines(chunk)
+    return path
+
+def _merge_run_files(paths, dst, key, buffer_size):
+    files = [open(path, "rb", buffering=buffer_size) for path in paths]
+    try:
+        dst.writelines(kway_merge(*files, key=key))
+    finally:
+        for f in files:
+            f.close()
+
+
+def parallel_sort(values, typecode="d", processes=None, chunks=None):
+    # Sorts a numeric sequence across a process pool and returns a new array(typecode).
+    # The values are copied once into a shared memory block; workers attach to it by name
+    # and sort ranges of it in place, so no element is pickled. The first round sorts each
+    # chunk; every later round re-sorts pairs of adjacent sorted runs, which timsort merges
+    # in one linear pass in C, until one run is left. A Python-level k-way merge of every
+    # element would cost more than sorted() on the whole input, so none is done here.
+    n = len(values)
+    processes = processes or os.cpu_count() or 1
+    chunks = max(1, min(chunks or processes, n))
+    if n < 2 or chunks == 1:
+        return array(typecode, sorted(values))
+
+    itemsize = array(typecode).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    shared = shm.buf.cast(typecode)
+    try:
+        shared[:] = values if isinstance(values, array) and values.typecode == typecode else array(typecode, values)
+        runs = [n * i // chunks for i in range(chunks + 1)]
+        ranges = list(zip(runs, runs[1:]))
+        with ProcessPoolExecutor(max_workers=min(processes, chunks)) as pool:
+            while ranges:
+                futures = [pool.submit(_sort_shared_range, shm.name, typecode, lo, hi) for lo, hi in ranges]
+                for future in futures:
+                    future.result()
+                # Pair up adjacent runs; an odd run out carries over to the next round as is
+                count = len(runs) - 1
+                ranges = [(runs[i], runs[i + 2]) for i in range(0, count - 1, 2)]
+                runs = runs[::2] + ([runs[-1]] if count % 2 else [])
+        out = array(typecode)
+        with shm.buf[:n * itemsize] as raw:
+            out.frombytes(raw)
+        return out
+    finally:
+        shared.release()
+        shm.close()
+        shm.unlink()
+
+def _sort_shared_range(name, typecode, lo, hi):
+    shm = shared_memory.SharedMemory(name=name)
+    shared = shm.buf.cast(typecode)
+    try:
+        shared[lo:hi] = array(typecode, sorted(shared[lo:hi]))
+    finally:
+        shared.release()
+        shm.close()
@@ -0,0 +1,333 @@
+import argparse
+import functools
+import heapq
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+from DataStructuresRevision import (MinHeap, NumericMinHeap, bubble_sort, counting_sort, external_sort, insertion_sort,
+                                    kway_merge, merge_sort, nlargest, np, nsmallest, parallel_sort, quick_sort,
+                                    radix_sort, selection_sort)
+
+# ===========================
+# Helpers
+# ===========================
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+def random_floats(size, seed):
+    rnd = random.Random(seed)
+    return [rnd.random() for _ in range(size)]
+
+# ===========================
+# MinHeap vs heapq
+# ===========================
+
+def benchmark_heap(size=10_000_000, seed=1):
+    data = random_floats(size, seed)
+
+    def heap_push_all():
+        heap = MinHeap()
+        for val in data:
+            heap.push(val)
+        return heap
+
+    def heapq_push_all():
+        heap = []
+        for val in data:
+            heapq.heappush(heap, val)
+        return heap
+
+    def heap_pop_all(heap):
+        pop = heap.pop
+        for _ in range(len(heap)):
+            pop()
+
+    def heapq_pop_all(heap):
+        for _ in range(len(heap)):
+            heapq.heappop(heap)
+
+    def heap_pushpop_all(heap):
+        for val in data:
+            heap.pushpop(val)
+
+    def heapq_pushpop_all(heap):
+        for val in data:
+            heapq.heappushpop(heap, val)
+
+    results = {"size": size}
+    results["minheap_push_s"], heap = timed(heap_push_all)
+    results["heapq_push_s"], ref = timed(heapq_push_all)
+    results["minheap_pushpop_s"], _ = timed(heap_pushpop_all, heap)
+    results["heapq_pushpop_s"], _ = timed(heapq_pushpop_all, ref)
+    results["minheap_pop_s"], _ = timed(heap_pop_all, heap)
+    results["heapq_pop_s"], _ = timed(heapq_pop_all, ref)
+    results["minheap_from_iterable_s"], _ = timed(MinHeap.from_iterable, data)
+    results["heapq_heapify_s"], _ = timed(heapq.heapify, list(data))
+    return {key: round(value, 4) if isinstance(value, float) else value for key, value in results.items()}
+
+# ===========================
+# NumericMinHeap
+# ===========================
+
+def benchmark_numeric_heap(size=10_000_000, events=1_000_000, seed=7):
+    # Event-simulation shape: bulk-load timestamps, then repeatedly pop the earliest event
+    # and schedule a later one. Memory is bytes per element of the heap storage itself.
+    data = random_floats(size, seed)
+    rnd = random.Random(seed)
+    delays = [rnd.random() for _ in range(events)]
+    batch = random_floats(size // 10, seed + 1)
+
+    def simulate(heap):
+        for delay in delays:
+            heap.replace(heap.peek() + delay)
+
+    results = {"size": size, "events": events}
+    elapsed, heap = timed(MinHeap.from_iterable, data)
+    results["minheap_build_s"] = elapsed
+    results["minheap_bytes_per_item"] = (sys.getsizeof(heap.min_heap) + size * sys.getsizeof(1.0)) / size
+    results["minheap_simulate_s"], _ = timed(simulate, heap)
+    del heap
+
+    backends = [("array", False)] + ([("numpy", True)] if np is not None else [])
+    for name, use_numpy in backends:
+        values = np.array(data) if use_numpy else array("d", data)
+        elapsed, heap = timed(NumericMinHeap.from_iterable, values, "d", use_numpy)
+        results[f"numeric_{name}_build_s"] = elapsed
+        results[f"numeric_{name}_bytes_per_item"] = heap.capacity * 8 / len(heap)
+        results[f"numeric_{name}_push_many_s"], _ = timed(heap.push_many, batch)
+        results[f"numeric_{name}_simulate_s"], _ = timed(simulate, heap)
+        assert heap.pop() <= heap.peek()
+    return {key: round(value, 4) if isinstance(value, float) else value for key, value in results.items()}
+
+# ===========================
+# External Sort
+# ===========================
+
+def benchmark_external_sort(records=1_000_000, max_memory_bytes=16 * 2**20, seed=2):
+    rnd = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "input.txt")
+        output_path = os.path.join(directory, "output.txt")
+        with open(input_path, "wb") as f:
+            f.writelines(b"%d,%d\n" % (rnd.getrandbits(48), i) for i in range(records))
+        size = os.path.getsize(input_path)
+
+        elapsed, _ = timed(external_sort, input_path, output_path, None, max_memory_bytes)
+        with open(output_path, "rb") as f:
+            previous = b""
+            for record in f:
+                assert previous <= record
+                previous = record
+
+    return {
+        "records": records,
+        "input_mb": round(size / 2**20, 2),
+        "max_memory_mb": round(max_memory_bytes / 2**20, 2),
+        "total_s": round(elapsed, 4),
+        "records_per_s": round(records / elapsed),
+    }
+
+# ===========================
+# Parallel Sort
+# ===========================
+
+def benchmark_parallel_sort(size=10_000_000, max_processes=None, seed=4):
+    # Scaling from 1 to max_processes workers, one chunk per worker. vs_sorted > 1 means
+    # parallel_sort beat sorted() on the whole input; the last merge round is one worker
+    # merging every element, so the gain flattens out after a few cores. With fewer cores
+    # than workers the chunk sorts run one after another and vs_sorted stays below 1.
+    values = array("d", random_floats(size, seed))
+    baseline_s, expected = timed(sorted, values)
+    results = {"size": size, "cpus": os.cpu_count(), "sorted_s": round(baseline_s, 4), "runs": []}
+    single_s = None
+    for processes in range(1, (max_processes or os.cpu_count() or 1) + 1):
+        elapsed, out = timed(parallel_sort, values, "d", processes)
+        assert out.tolist() == expected
+        single_s = single_s or elapsed
+        results["runs"].append({
+            "processes": processes,
+            "total_s": round(elapsed, 4),
+            "speedup": round(single_s / elapsed, 2),
+            "vs_sorted": round(baseline_s / elapsed, 2),
+        })
+    return results
+
+# ===========================
+# Integer Sorts
+# ===========================
+
+def benchmark_integer_sorts(size=10_000_000, seed=5):
+    # 64-bit keys: full-range random IDs, and one day of second-resolution timestamps, whose
+    # narrow range suits counting sort. NumPy buffers are measured too when NumPy is installed.
+    rnd = random.Random(seed)
+    start = 1_700_000_000
+    inputs = {
+        "random_ids": array("q", (rnd.getrandbits(64) - 2**63 for _ in range(size))),
+        "timestamps": array("q", (start + rnd.randrange(86_400) for _ in range(size))),
+    }
+    results = {"size": size, "numpy": np is not None}
+    for name, values in inputs.items():
+        lst = values.tolist()
+        row = {}
+        row["list.sort_s"], _ = timed(lst.sort)
+        for sort in (radix_sort, counting_sort):
+            elapsed, out = timed(sort, values)
+            assert out.tolist() == lst
+            row[f"{sort.__name__}_s"] = elapsed
+        if np is not None:
+            buffer = np.frombuffer(values, dtype=np.int64)
+            row["np.sort_s"], expected = timed(np.sort, buffer)
+            for sort in (radix_sort, counting_sort):
+                elapsed, out = timed(sort, buffer)
+                assert (out == expected).all()
+                row[f"numpy_{sort.__name__}_s"] = elapsed
+        results[name] = {key: round(value, 4) for key, value in row.items()}
+    return results
+
+# ===========================
+# Streaming Top-k and Merge
+# ===========================
+
+def benchmark_streaming(sizes=(1_000, 100_000, 10_000_000), k=100, ways=16, seed=6):
+    # Inputs are generated on the fly so the 10M case never exists as a list; each variant
+    # is checked against its heapq counterpart.
+    results = []
+    for size in sizes:
+        def stream():
+            rnd = random.Random(seed)
+            return (rnd.random() for _ in range(size))
+
+        def sorted_inputs():
+            return [range(i, size, ways) for i in range(ways)]
+
+        row = {"size": size, "k": k, "ways": ways}
+        row["nsmallest_s"], smallest = timed(lambda: list(nsmallest(k, stream())))
+        row["heapq_nsmallest_s"], expected = timed(heapq.nsmallest, k, stream())
+        assert smallest == expected
+        row["nlargest_s"], largest = timed(lambda: list(nlargest(k, stream())))
+        row["heapq_nlargest_s"], expected = timed(heapq.nlargest, k, stream())
+        assert largest == expected
+        row["kway_merge_s"], total = timed(lambda: sum(kway_merge(*sorted_inputs())))
+        row["heapq_merge_s"], expected = timed(lambda: sum(heapq.merge(*sorted_inputs())))
+        assert total == expected
+        results.append({key: round(value, 4) if isinstance(value, float) else value for key, value in row.items()})
+    return results
+
+# ===========================
+# Sorting Suite
+# ===========================
+
+QUADRATIC_SORTS = {"bubble_sort": bubble_sort, "selection_sort": selection_sort, "insertion_sort": insertion_sort}
+NLOGN_SORTS = {"merge_sort": merge_sort, "quick_sort": quick_sort, "list.sort": list.sort}
+
+def make_input(distribution, size, seed):
+    rnd = random.Random(seed)
+    if distribution == "random":
+        return [rnd.random() for _ in range(size)]
+    if distribution == "sorted":
+        return list(range(size))
+    if distribution == "reverse":
+        return list(range(size, 0, -1))
+    if distribution == "few_unique":
+        return [rnd.randrange(10) for _ in range(size)]
+    if distribution == "nearly_sorted":
+        data = list(range(size))
+        for _ in range(max(1, size // 100)):
+            i, j = rnd.randrange(size), rnd.randrange(size)
+            data[i], data[j] = data[j], data[i]
+        return data
+    raise ValueError(f"unknown distribution {distribution!r}")
+
+DISTRIBUTIONS = ("random", "sorted", "reverse", "few_unique", "nearly_sorted")
+
+@functools.total_ordering
+class Counted:
+    # Wraps a value and counts every comparison made against it
+    __slots__ = ("val",)
+    comparisons = 0
+
+    def __init__(self, val):
+        self.val = val
+
+    def __lt__(self, other):
+        Counted.comparisons += 1
+        return self.val < other.val
+
+    def __eq__(self, other):
+        Counted.comparisons += 1
+        return self.val == other.val
+
+def count_comparisons(sort, data):
+    wrapped = [Counted(val) for val in data]
+    Counted.comparisons = 0
+    sort(wrapped)
+    return Counted.comparisons
+
+def benchmark_sorts(sizes=(1_000, 10_000, 100_000, 1_000_000), distributions=DISTRIBUTIONS,
+                    max_quadratic_size=10_000, max_counted_comparisons=5_000_000, seed=3):
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            data = make_input(distribution, size, seed)
+            expected = sorted(data)
+            for name, sort in {**QUADRATIC_SORTS, **NLOGN_SORTS}.items():
+                result = {"sort": name, "distribution": distribution, "size": size}
+                if name in QUADRATIC_SORTS and size > max_quadratic_size:
+                    results.append(dict(result, skipped=True))
+                    continue
+                lst = list(data)
+                elapsed, _ = timed(sort, lst)
+                result["seconds"] = round(elapsed, 6)
+                result["correct"] = lst == expected
+                # Counting wraps every element, so only do it while the expected work stays small
+                expected_comparisons = size * size // 2 if name in QUADRATIC_SORTS else size * size.bit_length()
+                if expected_comparisons <= max_counted_comparisons:
+                    result["comparisons"] = count_comparisons(sort, data)
+                else:
+                    result["comparisons"] = None
+                results.append(result)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DataStructuresRevision benchmarks")
+    parser.add_argument("--suite", choices=("all", "heap", "sorts", "external", "parallel", "integer", "streaming", "numeric-heap"), default="all")
+    parser.add_argument("--size", type=int, default=10_000_000, help="elements for the heap benchmarks")
+    parser.add_argument("--sort-sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--parallel-size", type=int, default=10_000_000)
+    parser.add_argument("--max-processes", type=int, default=None)
+    parser.add_argument("--integer-size", type=int, default=10_000_000)
+    parser.add_argument("--streaming-sizes", type=int, nargs="+", default=[1_000, 100_000, 10_000_000])
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    results = {}
+    if args.suite in ("all", "heap"):
+        results["heap"] = benchmark_heap(args.size)
+    if args.suite in ("all", "numeric-heap"):
+        results["numeric_heap"] = benchmark_numeric_heap(args.size)
+    if args.suite in ("all", "sorts"):
+        results["sorts"] = benchmark_sorts(args.sort_sizes)
+    if args.suite in ("all", "external"):
+        results["external_sort"] = benchmark_external_sort()
+    if args.suite in ("all", "parallel"):
+        results["parallel_sort"] = benchmark_parallel_sort(args.parallel_size, args.max_processes)
+    if args.suite in ("all", "integer"):
+        results["integer_sorts"] = benchmark_integer_sorts(args.integer_size)
+    if args.suite in ("all", "streaming"):
+        results["streaming"] = benchmark_streaming(args.streaming_sizes)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+    failures = [r for r in results.get("sorts", []) if r.get("correct") is False]
+    if failures:
+        raise SystemExit(f"{len(failures)} sort runs returned wrong results")
@@ -1,6 +1,14 @@
+import contextlib
+import gc
+import heapq
+import json
+import os
+from array import array
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from datetime import datetime
+from threading import Lock
 
 # ===========================
 # Enums
@@ -16,6 +24,10 @@ class SpotType(Enum):
     LARGE = "Large"
     HANDICAPPED = "Handicapped"
 
+class AllocationOrder(Enum):
+    LOWEST_FLOOR_FIRST = "LowestFloorFirst"
+    NEAREST_TO_ENTRANCE = "NearestToEntrance"
+
 # ===========================
 # Vehicle
 # ===========================
@@ -36,10 +48,14 @@ class Vehicle:
 # ===========================
 
 class ParkingSpot:
-    def __init__(self, spot_id, spot_type):
+    def __init__(self, spot_id, spot_type, floor=None, position=0):
         self.spot_id = spot_id
         self.spot_type = spot_type
+        self.floor = floor
+        # Position on the floor; a lower position is closer to the floor entrance
+        self.position = position
         self._vehicle = None
+        self._indexed = False
 
     def is_available(self):
         return self._vehicle is None
@@ -48,12 +64,16 @@ class ParkingSpot:
         if not self.is_available():
             return False
         self._vehicle = vehicle
+        if self.floor is not None:
+            self.floor.on_spot_assigned(self)
         return True
 
     def release_vehicle(self):
         if self._vehicle is None:
             return False
         self._vehicle = None
+        if self.floor is not None:
+            self.floor.on_spot_released(self)
         return True
 
     def get_vehicle(self):
@@ -73,32 +93,379 @@ class ParkingFloor:
     def __init__(self, floor_num, compact, large, handicapped):
         self.floor_num = floor_num
         self.parking_spots = []
+        self.spots_by_id = {}
+        self.lot = None
+        self.lock = Lock()
+        # Min-heap of free spot positions per spot type
+        self.free_spots = {spot_type: [] for spot_type in SpotType}
+        self.total_counts = {SpotType.COMPACT: compact, SpotType.LARGE: large, SpotType.HANDICAPPED: handicapped}
+        self.free_counts = dict(self.total_counts)
 
         for i in range(compact):
-            self.parking_spots.append(ParkingSpot(f"C{i}_F{floor_num}", SpotType.COMPACT))
+            self._add_spot(f"C{i}_F{floor_num}", SpotType.COMPACT)
         for i in range(large):
-            self.parking_spots.append(ParkingSpot(f"L{i}_F{floor_num}", SpotType.LARGE))
+            self._add_spot(f"L{i}_F{floor_num}", SpotType.LARGE)
         for i in range(handicapped):
-            self.parking_spots.append(ParkingSpot(f"H{i}_F{floor_num}", SpotType.HANDICAPPED))
+            self._add_spot(f"H{i}_F{floor_num}", SpotType.HANDICAPPED)
+
+    def _add_spot(self, spot_id, spot_type):
+        spot = ParkingSpot(spot_id, spot_type, self, len(self.parking_spots))
+        self.parking_spots.append(spot)
+        self.spots_by_id[spot_id] = spot
+        # Positions are increasing, so appending keeps the heap valid
+        self.free_spots[spot_type].append(spot.position)
+        spot._indexed = True
 
     def get_parking_spots(self):
         return self.parking_spots
 
+    def get_spot(self, spot_id):
+        return self.spots_by_id.get(spot_id)
+
+    def get_free_count(self, spot_type):
+        return self.free_counts[spot_type]
+
+    def get_used_count(self, spot_type):
+        return self.total_counts[spot_type] - self.free_counts[spot_type]
+
+    def get_free_spot(self, spot_type):
+        heap = self.free_spots[spot_type]
+        # Drop spots that were taken without going through the index
+        while heap and not self.parking_spots[heap[0]].is_available():
+            self.parking_spots[heapq.heappop(heap)]._indexed = False
+        return self.parking_spots[heap[0]] if heap else None
+
+    def on_spot_assigned(self, spot):
+        self.free_counts[spot.spot_type] -= 1
+        heap = self.free_spots[spot.spot_type]
+        if heap and heap[0] == spot.position:
+            heapq.heappop(heap)
+            spot._indexed = False
+        if self.lot is not None:
+            self.lot.on_floor_changed(self, spot.spot_type)
+
+    def on_spot_released(self, spot):
+        self.free_counts[spot.spot_type] += 1
+        if not spot._indexed:
+            heapq.heappush(self.free_spots[spot.spot_type], spot.position)
+            spot._indexed = True
+        if self.lot is not None:
+            self.lot.on_floor_changed(self, spot.spot_type)
+
+# ===========================
+# Compact Parking Floor
+# ===========================
+
+class CompactParkingSpot:
+    # Lightweight view over a CompactParkingFloor slot; holds no state of its own
+    __slots__ = ("floor", "position")
+
+    def __init__(self, floor, position):
+        self.floor = floor
+        self.position = position
+
+    @property
+    def spot_type(self):
+        return self.floor.get_spot_type(self.position)
+
+    @property
+    def spot_id(self):
+        return self.floor.get_spot_id(self.position)
+
+    def is_available(self):
+        return self.floor.is_available(self.position)
+
+    def assign_vehicle(self, vehicle):
+        return self.floor.assign_vehicle(self.position, vehicle)
+
+    def release_vehicle(self):
+        return self.floor.release_vehicle(self.position)
+
+    def get_vehicle(self):
+        return self.floor.get_vehicle(self.position)
+
+    def get_spot_id(self):
+        return self.spot_id
+
+    def get_spot_type(self):
+        return self.spot_type
+
+class CompactParkingFloor:
+    SPOT_TYPES = list(SpotType)
+    SPOT_PREFIXES = "CLH"
+    TYPE_CODES = {spot_type: code for code, spot_type in enumerate(SPOT_TYPES)}
+
+    def __init__(self, floor_num, compact, large, handicapped):
+        self.floor_num = floor_num
+        self.lot = None
+        self.lock = Lock()
+        self.total_spots = compact + large + handicapped
+
+        # Per type code: [start, end) position range; spots are laid out by type
+        self._starts = [0, compact, compact + large]
+        self._ends = [compact, compact + large, self.total_spots]
+        self._spot_types = bytearray(b"\x00" * compact + b"\x01" * large + b"\x02" * handicapped)
+        # Index into _vehicles for each spot, -1 when free
+        self._occupants = array('i', [-1]) * self.total_spots
+        self._vehicles = []
+        self._free_slots = []
+
+        # Free index per type code: every position >= cursor is free unless assigned directly,
+        # released positions below the cursor go back on a min-heap.
+        self._cursors = list(self._starts)
+        self._released = [[] for _ in self.SPOT_TYPES]
+        self._indexed = bytearray(self.total_spots)
+        self._free_counts = [compact, large, handicapped]
+
+    def get_spot_type(self, position):
+        return self.SPOT_TYPES[self._spot_types[position]]
+
+    def get_spot_id(self, position):
+        code = self._spot_types[position]
+        return f"{self.SPOT_PREFIXES[code]}{position - self._starts[code]}_F{self.floor_num}"
+
+    def is_available(self, position):
+        return self._occupants[position] < 0
+
+    def get_free_count(self, spot_type):
+        return self._free_counts[self.TYPE_CODES[spot_type]]
+
+    def get_used_count(self, spot_type):
+        code = self.TYPE_CODES[spot_type]
+        return self._ends[code] - self._starts[code] - self._free_counts[code]
+
+    def get_vehicle(self, position):
+        slot = self._occupants[position]
+        return self._vehicles[slot] if slot >= 0 else None
+
+    def assign_vehicle(self, position, vehicle):
+        if self._occupants[position] >= 0:
+            return False
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._vehicles[slot] = vehicle
+        else:
+            slot = len(self._vehicles)
+            self._vehicles.append(vehicle)
+        self._occupants[position] = slot
+
+        code = self._spot_types[position]
+        self._free_counts[code] -= 1
+        heap = self._released[code]
+        if heap and heap[0] == position:
+            heapq.heappop(heap)
+            self._indexed[position] = 0
+        elif position == self._cursors[code]:
+            self._advance_cursor(code)
+        if self.lot is not None:
+            self.lot.on_floor_changed(self, self.SPOT_TYPES[code])
+        return True
+
+    def release_vehicle(self, position):
+        slot = self._occupants[position]
+        if slot < 0:
+            return False
+        self._vehicles[slot] = None
+        self._free_slots.append(slot)
+        self._occupants[position] = -1
+
+        code = self._spot_types[position]
+        self._free_counts[code] += 1
+        if position < self._cursors[code] and not self._indexed[position]:
+            heapq.heappush(self._released[code], position)
+            self._indexed[position] = 1
+        if self.lot is not None:
+            self.lot.on_floor_changed(self, self.SPOT_TYPES[code])
+        return True
+
+    def _advance_cursor(self, code):
+        cursor = self._cursors[code]
+        end = self._ends[code]
+        occupants = self._occupants
+        while cursor < end and occupants[cursor] >= 0:
+            cursor += 1
+        self._cursors[code] = cursor
+
+    def get_parking_spots(self):
+        # Materializes a view per spot; prefer get_spot/get_free_spot on large floors
+        return [CompactParkingSpot(self, position) for position in range(self.total_spots)]
+
+    def get_spot(self, spot_id):
+        code = self.SPOT_PREFIXES.find(spot_id[:1])
+        index, _, floor_num = spot_id[1:].partition("_F")
+        if code < 0 or not index.isdigit() or floor_num != str(self.floor_num):
+            return None
+        position = self._starts[code] + int(index)
+        return CompactParkingSpot(self, position) if position < self._ends[code] else None
+
+    def get_free_spot(self, spot_type):
+        code = self.TYPE_CODES[spot_type]
+        heap = self._released[code]
+        while heap and self._occupants[heap[0]] >= 0:
+            self._indexed[heapq.heappop(heap)] = 0
+        if heap:
+            return CompactParkingSpot(self, heap[0])
+        self._advance_cursor(code)
+        if self._cursors[code] < self._ends[code]:
+            return CompactParkingSpot(self, self._cursors[code])
+        return None
+
+# ===========================
+# Allocation Policy
+# ===========================
+
+class AllocationPolicy(ABC):
+    # Candidate spot types are resolved once per (vehicle type, handicapped) pair, so a
+    # fallback costs one extra index lookup at park time
+
+    def __init__(self):
+        self._candidates = {
+            (vehicle_type, is_handicapped): tuple(self.candidate_spot_types(vehicle_type, is_handicapped))
+            for vehicle_type in VehicleType for is_handicapped in (False, True)
+        }
+
+    def get_required_spot_type(self, vehicle_type, is_handicapped):
+        if vehicle_type in [VehicleType.BIKE, VehicleType.CAR]:
+            return SpotType.HANDICAPPED if is_handicapped else SpotType.COMPACT
+        return SpotType.LARGE
+
+    def get_candidate_spot_types(self, vehicle_type, is_handicapped):
+        return self._candidates[(vehicle_type, is_handicapped)]
+
+    @abstractmethod
+    def candidate_spot_types(self, vehicle_type, is_handicapped):
+        pass
+
+class ExactFitPolicy(AllocationPolicy):
+    def candidate_spot_types(self, vehicle_type, is_handicapped):
+        return [self.get_required_spot_type(vehicle_type, is_handicapped)]
+
+class UpgradeOnFullPolicy(AllocationPolicy):
+    # Falls back to a LARGE spot when the required spot type is full
+    def candidate_spot_types(self, vehicle_type, is_handicapped):
+        required_spot_type = self.get_required_spot_type(vehicle_type, is_handicapped)
+        if required_spot_type == SpotType.LARGE:
+            return [required_spot_type]
+        return [required_spot_type, SpotType.LARGE]
+
+class BestFitPolicy(AllocationPolicy):
+    # Tries every spot type the vehicle fits in, smallest first
+    def candidate_spot_types(self, vehicle_type, is_handicapped):
+        if vehicle_type == VehicleType.TRUCK:
+            return [SpotType.LARGE]
+        if is_handicapped:
+            return [SpotType.HANDICAPPED, SpotType.COMPACT, SpotType.LARGE]
+        return [SpotType.COMPACT, SpotType.LARGE]
+
 # ===========================
 # Parking Lot
 # ===========================
 
 class ParkingLot:
-    def __init__(self, total_floors, compact_per_floor, large_per_floor, handicapped_per_floor):
+    def __init__(self, total_floors, compact_per_floor, large_per_floor, handicapped_per_floor,
+                 allocation_order=AllocationOrder.LOWEST_FLOOR_FIRST, compact_storage=False, allocation_policy=None):
         self.total_floors = total_floors
+        self.allocation_order = allocation_order
+        self.allocation_policy = allocation_policy or ExactFitPolicy()
+        floor_cls = CompactParkingFloor if compact_storage else ParkingFloor
         self.parking_floors = [
-            ParkingFloor(i, compact_per_floor, large_per_floor, handicapped_per_floor) for i in range(self.total_floors)
+            floor_cls(i, compact_per_floor, large_per_floor, handicapped_per_floor) for i in range(self.total_floors)
         ]
 
+        # Per spot type: min-heap of (order key, floor_num) for floors with a free spot of that type.
+        # Entries whose key no longer matches _floor_keys are stale and dropped lazily; once stale
+        # entries outnumber live ones the heap is rebuilt, so it stays within 2 * total_floors.
+        self._floor_index = {spot_type: [] for spot_type in SpotType}
+        self._floor_keys = {spot_type: {} for spot_type in SpotType}
+        # Sharded by spot type so gates looking for different types never contend
+        self._index_locks = {spot_type: Lock() for spot_type in SpotType}
+        for floor in self.parking_floors:
+            floor.lot = self
+            for spot_type in SpotType:
+                self.on_floor_changed(floor, spot_type)
+
+    def _order_key(self, floor, spot):
+        if self.allocation_order == AllocationOrder.NEAREST_TO_ENTRANCE:
+            return (spot.position, floor.floor_num)
+        return (floor.floor_num, 0)
+
+    def on_floor_changed(self, floor, spot_type):
+        # Called with the floor's state stable (under floor.lock when gates run concurrently)
+        spot = floor.get_free_spot(spot_type)
+        key = self._order_key(floor, spot) if spot else None
+        with self._index_locks[spot_type]:
+            keys = self._floor_keys[spot_type]
+            if keys.get(floor.floor_num) == key:
+                return
+            if key is None:
+                del keys[floor.floor_num]
+                return
+            keys[floor.floor_num] = key
+            heap = self._floor_index[spot_type]
+            if len(heap) >= 2 * self.total_floors:
+                heap[:] = [(floor_key, floor_num) for floor_num, floor_key in keys.items()]
+                heapq.heapify(heap)
+            else:
+                heapq.heappush(heap, (key, floor.floor_num))
+
+    @contextlib.contextmanager
+    def bulk_update(self):
+        # Detach floors so mass assignments skip per-spot index upkeep, then refresh once
+        for floor in self.parking_floors:
+            floor.lot = None
+        try:
+            yield self
+        finally:
+            for floor in self.parking_floors:
+                floor.lot = self
+                for spot_type in SpotType:
+                    self.on_floor_changed(floor, spot_type)
+
+    def find_free_floor(self, spot_type):
+        with self._index_locks[spot_type]:
+            heap = self._floor_index[spot_type]
+            keys = self._floor_keys[spot_type]
+            while heap:
+                key, floor_num = heap[0]
+                if keys.get(floor_num) == key:
+                    return self.parking_floors[floor_num]
+                heapq.heappop(heap)
+        return None
+
+    def find_free_spot(self, spot_type):
+        floor = self.find_free_floor(spot_type)
+        return floor.get_free_spot(spot_type) if floor else None
+
+    def get_free_count(self, spot_type, floor_num=None):
+        if floor_num is not None:
+            return self.parking_floors[floor_num].get_free_count(spot_type)
+        return sum(floor.get_free_count(spot_type) for floor in self.parking_floors)
+
+    def get_used_count(self, spot_type, floor_num=None):
+        if floor_num is not None:
+            return self.parking_floors[floor_num].get_used_count(spot_type)
+        return sum(floor.get_used_count(spot_type) for floor in self.parking_floors)
+
+    def get_availability_snapshot(self):
+        # Reads the incremental counters only; counters are not locked, so a snapshot
+        # taken while gates are running may be off by the in-flight operations
+        floors = {}
+        totals = {spot_type.value: {"free": 0, "used": 0} for spot_type in SpotType}
+        for floor in self.parking_floors:
+            counts = {}
+            for spot_type in SpotType:
+                free, used = floor.get_free_count(spot_type), floor.get_used_count(spot_type)
+                counts[spot_type.value] = {"free": free, "used": used}
+                totals[spot_type.value]["free"] += free
+                totals[spot_type.value]["used"] += used
+            floors[floor.floor_num] = counts
+        return {"taken_at": datetime.now().isoformat(), "floors": floors, "total": totals}
+
     def get_required_spot_type(self, vehicle_type, is_handicapped):
-        if vehicle_type in [VehicleType.BIKE, VehicleType.CAR]:
-            return SpotType.HANDICAPPED if is_handicapped else SpotType.COMPACT
-        return SpotType.LARGE
+        return self.allocation_policy.get_required_spot_type(vehicle_type, is_handicapped)
+
+    def get_candidate_spot_types(self, vehicle_type, is_handicapped):
+        return self.allocation_policy.get_candidate_spot_types(vehicle_type, is_handicapped)
 
 # ===========================
 # Parking Ticket
@@ -111,45 +478,345 @@ class ParkingTicket:
         self.floor = floor
         self.issued_at = datetime.now()
 
+# ===========================
+# Logging
+# ===========================
+
+class ParkingLogger(ABC):
+    @abstractmethod
+    def log(self, message):
+        pass
+
+class ConsoleLogger(ParkingLogger):
+    def log(self, message):
+        print(message)
+
+class NullLogger(ParkingLogger):
+    def log(self, message):
+        pass
+
+class BufferedLogger(ParkingLogger):
+    def __init__(self):
+        self.messages = []
+
+    def log(self, message):
+        self.messages.append(message)
+
+# ===========================
+# Ticket Journal
+# ===========================
+
+class ParkingJournal:
+    # Append-only log of park/unpark events split into numbered segments. A snapshot holds
+    # the active tickets as of the start of one segment, so recovery loads the snapshot and
+    # replays only that segment and any later ones.
+
+    def __init__(self, path, snapshot_every=10_000, flush_every=1, fsync=False):
+        self.path = path
+        self.snapshot_path = f"{path}.snapshot"
+        self.snapshot_every = snapshot_every
+        self.flush_every = flush_every
+        self.fsync = fsync
+        self.manager = None
+        self._lock = Lock()
+        self._file = None
+        self._segment = 0
+        self._pending = 0
+        self._since_snapshot = 0
+        # Snapshots are serialized and written by one background thread, in order, so a gate
+        # that crosses snapshot_every only pays for rolling the segment and copying the tickets
+        self._snapshot_writer = ThreadPoolExecutor(max_workers=1)
+        self._snapshot_future = None
+
+    def _segment_path(self, segment):
+        return f"{self.path}.{segment:08d}.log"
+
+    def _segments(self):
+        directory, prefix = os.path.split(os.path.abspath(self.path))
+        segments = []
+        for name in os.listdir(directory):
+            number = name[len(prefix) + 1:-len(".log")]
+            if name.startswith(prefix + ".") and name.endswith(".log") and number.isdigit():
+                segments.append(int(number))
+        return sorted(segments)
+
+    def attach(self, manager):
+        # Always start a fresh segment so a torn last line from a crash is never appended to
+        self.manager = manager
+        segments = self._segments()
+        self._segment = segments[-1] + 1 if segments else 0
+        self._file = open(self._segment_path(self._segment), "a", encoding="utf-8")
+
+    def record_park(self, ticket):
+        vehicle = ticket.vehicle
+        self._write(f"P\t{vehicle.get_vehicle_reg_num()}\t{vehicle.get_vehicle_type().value}\t"
+                    f"{ticket.floor}\t{ticket.spot_id}\t{ticket.issued_at.isoformat()}\n")
+
+    def record_unpark(self, vehicle_reg_num):
+        self._write(f"U\t{vehicle_reg_num}\n")
+
+    def _write(self, line):
+        with self._lock:
+            self._file.write(line)
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._flush()
+            self._since_snapshot += 1
+            if self._since_snapshot >= self.snapshot_every:
+                self._start_snapshot()
+
+    def _flush(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def write_snapshot(self):
+        with self._lock:
+            future = self._start_snapshot()
+        future.result()
+
+    def _start_snapshot(self):
+        # Under the journal lock: roll to a new segment and copy the ticket list. The snapshot
+        # then describes the state at the new segment's start; events racing the copy may
+        # land in both, which replay tolerates. Serializing and writing happen off the lock.
+        self._flush()
+        self._file.close()
+        self._segment += 1
+        self._file = open(self._segment_path(self._segment), "a", encoding="utf-8")
+        self._since_snapshot = 0
+        tickets = list(self.manager.active_tickets.values())
+        self._snapshot_future = self._snapshot_writer.submit(self._write_snapshot, self._segment, tickets)
+        return self._snapshot_future
+
+    SNAPSHOT_CHUNK = 1_000
+
+    def _write_snapshot(self, segment, tickets):
+        # json.dumps holds the GIL for the whole call, so the ticket list is encoded a chunk
+        # at a time to let gate threads run in between
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f'{{"segment":{segment},"tickets":[')
+            for start in range(0, len(tickets), self.SNAPSHOT_CHUNK):
+                chunk = [
+                    [ticket.vehicle.get_vehicle_reg_num(), ticket.vehicle.get_vehicle_type().value, ticket.floor,
+                     ticket.spot_id, ticket.issued_at.isoformat()]
+                    for ticket in tickets[start:start + self.SNAPSHOT_CHUNK]
+                ]
+                if start:
+                    f.write(",")
+                f.write(json.dumps(chunk, separators=(",", ":"))[1:-1])
+            f.write("]}")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        # Older segments are only dropped once the snapshot covering them is in place
+        for old_segment in self._segments():
+            if old_segment < segment:
+                os.remove(self._segment_path(old_segment))
+
+    def recover(self, manager):
+        # Recovery allocates tens of thousands of tickets at once; pause the cyclic GC so it
+        # doesn't run repeated collections over objects that are all going to stay alive
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with manager.parking_lot.bulk_update():
+                return self._recover(manager)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _recover(self, manager):
+        segment = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            segment = snapshot["segment"]
+            for reg_num, vehicle_type, floor, spot_id, issued_at in snapshot["tickets"]:
+                manager.restore_ticket(reg_num, vehicle_type, floor, spot_id, issued_at)
+
+        replayed = 0
+        for tail_segment in self._segments():
+            if tail_segment < segment:
+                continue
+            with open(self._segment_path(tail_segment), encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break  # torn final write
+                    fields = line[:-1].split("\t")
+                    if fields[0] == "P":
+                        _, reg_num, vehicle_type, floor, spot_id, issued_at = fields
+                        manager.restore_ticket(reg_num, vehicle_type, int(floor), spot_id, issued_at)
+                    else:
+                        manager.restore_unpark(fields[1])
+                    replayed += 1
+        return replayed
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._flush()
+                self._file.close()
+                self._file = None
+        # Wait for any snapshot still being written, and surface its error if it failed
+        self._snapshot_writer.shutdown(wait=True)
+        if self._snapshot_future is not None:
+            self._snapshot_future.result()
+
 # ===========================
 # Parking Manager
 # ===========================
 
 class ParkingManager:
-    def __init__(self, parking_lot):
+    def __init__(self, parking_lot, logger=None, journal=None):
         self.parking_lot = parking_lot
         self.active_tickets = {}
+        self.logger = logger or ConsoleLogger()
+        self.journal = journal
+
+        if journal:
+            journal.recover(self)
+            journal.attach(self)
+            self.logger.log(f"♻️ Recovered {len(self.active_tickets)} active tickets")
 
     def park_vehicle(self, vehicle, is_handicapped=False):
-        required_spot_type = self.parking_lot.get_required_spot_type(vehicle.get_vehicle_type(), is_handicapped)
-
-        for floor in self.parking_lot.parking_floors:
-            for spot in floor.get_parking_spots():
-                if spot.get_spot_type() == required_spot_type and spot.is_available():
-                    spot.assign_vehicle(vehicle)
-                    ticket = ParkingTicket(vehicle, spot.get_spot_id(), floor.floor_num)
-                    self.active_tickets[vehicle.get_vehicle_reg_num()] = ticket
-                    print(f"✅ Vehicle {vehicle.get_vehicle_reg_num()} parked at spot {spot.get_spot_id()}")
-                    return ticket
-        print(f"❌ No Parking Spot available for {vehicle.get_vehicle_reg_num()}")
+        ticket = self._park(vehicle, is_handicapped)
+        if ticket:
+            self.logger.log(f"✅ Vehicle {vehicle.get_vehicle_reg_num()} parked at spot {ticket.spot_id}")
+            return ticket
+        self.logger.log(f"❌ No Parking Spot available for {vehicle.get_vehicle_reg_num()}")
         return None
 
     def unpark_vehicle(self, vehicle_reg_num):
         ticket = self.active_tickets.get(vehicle_reg_num)
         if not ticket:
-            print(f"⚠️ No active ticket found for {vehicle_reg_num}")
+            self.logger.log(f"⚠️ No active ticket found for {vehicle_reg_num}")
             return False
 
-        floor = self.parking_lot.parking_floors[ticket.floor]
-        for spot in floor.get_parking_spots():
-            if spot.get_spot_id() == ticket.spot_id:
-                if spot.release_vehicle():
-                    print(f"🟢 Vehicle {vehicle_reg_num} removed from spot {spot.get_spot_id()}")
-                    del self.active_tickets[vehicle_reg_num]
-                    return True
-        print(f"❌ Could not unpark {vehicle_reg_num}")
+        if self._unpark(vehicle_reg_num, ticket):
+            self.logger.log(f"🟢 Vehicle {vehicle_reg_num} removed from spot {ticket.spot_id}")
+            return True
+        self.logger.log(f"❌ Could not unpark {vehicle_reg_num}")
         return False
 
+    def park_many(self, events):
+        # Events are vehicles or (vehicle, is_handicapped) pairs; logs one summary line, not one per event
+        park = self._park
+        tickets = []
+        for event in events:
+            if isinstance(event, tuple):
+                tickets.append(park(*event))
+            else:
+                tickets.append(park(event, False))
+        parked = len(tickets) - tickets.count(None)
+        self.logger.log(f"✅ Parked {parked} of {len(tickets)} vehicles")
+        return tickets
+
+    def unpark_many(self, vehicle_reg_nums):
+        active_tickets = self.active_tickets
+        unpark = self._unpark
+        results = []
+        for vehicle_reg_num in vehicle_reg_nums:
+            ticket = active_tickets.get(vehicle_reg_num)
+            results.append(unpark(vehicle_reg_num, ticket) if ticket else False)
+        self.logger.log(f"🟢 Unparked {results.count(True)} of {len(results)} vehicles")
+        return results
+
+    def _park(self, vehicle, is_handicapped):
+        for spot_type in self.parking_lot.get_candidate_spot_types(vehicle.get_vehicle_type(), is_handicapped):
+            ticket = self._assign_spot(spot_type, vehicle)
+            if ticket:
+                return ticket
+        return None
+
+    def _unpark(self, vehicle_reg_num, ticket):
+        return self._release_spot(ticket) is not None
+
+    def _issue_ticket(self, spot, vehicle):
+        # Called by _assign_spot right after the spot is taken, and under the floor lock in
+        # ConcurrentParkingManager, so journal lines for a spot are written in spot order
+        ticket = ParkingTicket(vehicle, spot.get_spot_id(), spot.floor.floor_num)
+        self.active_tickets[vehicle.get_vehicle_reg_num()] = ticket
+        if self.journal:
+            self.journal.record_park(ticket)
+        return ticket
+
+    def _close_ticket(self, ticket):
+        # Counterpart of _issue_ticket, called by _release_spot right after the spot is freed
+        vehicle_reg_num = ticket.vehicle.get_vehicle_reg_num()
+        self.active_tickets.pop(vehicle_reg_num, None)
+        if self.journal:
+            self.journal.record_unpark(vehicle_reg_num)
+
+    def restore_ticket(self, vehicle_reg_num, vehicle_type, floor, spot_id, issued_at):
+        # Replays a journaled park without journaling it again; repeats are ignored
+        if vehicle_reg_num in self.active_tickets:
+            return self.active_tickets[vehicle_reg_num]
+        spot = self.parking_lot.parking_floors[floor].get_spot(spot_id)
+        vehicle = Vehicle(vehicle_reg_num, VehicleType(vehicle_type))
+        if not spot or not spot.assign_vehicle(vehicle):
+            return None
+        ticket = ParkingTicket(vehicle, spot_id, floor)
+        ticket.issued_at = datetime.fromisoformat(issued_at)
+        self.active_tickets[vehicle_reg_num] = ticket
+        return ticket
+
+    def restore_unpark(self, vehicle_reg_num):
+        ticket = self.active_tickets.pop(vehicle_reg_num, None)
+        if ticket:
+            self.parking_lot.parking_floors[ticket.floor].get_spot(ticket.spot_id).release_vehicle()
+        return ticket is not None
+
+    def _assign_spot(self, spot_type, vehicle):
+        # Returns the new ticket, or None when no spot of spot_type is free
+        spot = self.parking_lot.find_free_spot(spot_type)
+        if spot and spot.assign_vehicle(vehicle):
+            return self._issue_ticket(spot, vehicle)
+        return None
+
+    def _release_spot(self, ticket):
+        spot = self.parking_lot.parking_floors[ticket.floor].get_spot(ticket.spot_id)
+        if spot and spot.release_vehicle():
+            self._close_ticket(ticket)
+            return spot
+        return None
+
+# ===========================
+# Concurrent Parking Manager
+# ===========================
+
+class ConcurrentParkingManager(ParkingManager):
+    # Safe for many gate threads: spot changes happen under the owning floor's lock and
+    # the lot index is locked per spot type, so gates working different floors don't block.
+
+    def _assign_spot(self, spot_type, vehicle):
+        while True:
+            floor = self.parking_lot.find_free_floor(spot_type)
+            if floor is None:
+                return None
+            with floor.lock:
+                spot = floor.get_free_spot(spot_type)
+                if spot and spot.assign_vehicle(vehicle):
+                    return self._issue_ticket(spot, vehicle)
+            # Another gate took the floor's last spot first; retry with the refreshed index
+
+    def _release_spot(self, ticket):
+        floor = self.parking_lot.parking_floors[ticket.floor]
+        with floor.lock:
+            spot = floor.get_spot(ticket.spot_id)
+            # Guard against a duplicate exit racing a new arrival into the same spot
+            if spot and spot.get_vehicle() is ticket.vehicle and spot.release_vehicle():
+                self._close_ticket(ticket)
+                return spot
+        return None
+
 # ===========================
 # Test
 # ===========================
@@ -170,3 +837,11 @@ if __name__ == "__main__":
 
     manager.unpark_vehicle("BIKE-123")
     manager.park_vehicle(another_truck)
+
+    upgrade_lot = ParkingLot(total_floors=1, compact_per_floor=1, large_per_floor=1, handicapped_per_floor=0,
+                             allocation_policy=UpgradeOnFullPolicy())
+    upgrade_manager = ParkingManager(upgrade_lot)
+    upgrade_manager.park_vehicle(Vehicle("CAR-111", VehicleType.CAR))
+    upgrade_manager.park_vehicle(Vehicle("CAR-222", VehicleType.CAR))
+
+    print(f"Free compact spots on floor 0: {lot.get_free_count(SpotType.COMPACT, floor_num=0)}")
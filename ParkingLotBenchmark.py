@@ -0,0 +1,338 @@
+import argparse
+import json
+import os
+import platform
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+from ParkingLot import (BestFitPolicy, ConcurrentParkingManager, ExactFitPolicy, NullLogger, ParkingJournal, ParkingLot,
+                        ParkingManager, UpgradeOnFullPolicy, Vehicle, VehicleType)
+
+# ===========================
+# Helpers
+# ===========================
+
+def build_lot(total_spots, floors=10, **kwargs):
+    per_floor = total_spots // floors
+    return ParkingLot(floors, per_floor, 0, 0, **kwargs)
+
+def fill_lot(manager, count, prefix="CAR"):
+    reg_nums = [f"{prefix}-{i}" for i in range(count)]
+    manager.park_many(Vehicle(reg_num, VehicleType.CAR) for reg_num in reg_nums)
+    return reg_nums
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def latency_summary(samples_ns):
+    samples_ns.sort()
+    return {
+        "count": len(samples_ns),
+        "p50_us": round(percentile(samples_ns, 50) / 1000, 3) if samples_ns else None,
+        "p99_us": round(percentile(samples_ns, 99) / 1000, 3) if samples_ns else None,
+        "max_us": round(samples_ns[-1] / 1000, 3) if samples_ns else None,
+    }
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return round(peak / 2**20 if platform.system() == "Darwin" else peak / 2**10, 2)
+
+# ===========================
+# Load Generator
+# ===========================
+
+VEHICLE_MIX = ((VehicleType.CAR, 0.75), (VehicleType.BIKE, 0.15), (VehicleType.TRUCK, 0.10))
+ALLOCATION_POLICIES = {"exact": ExactFitPolicy, "upgrade": UpgradeOnFullPolicy, "best-fit": BestFitPolicy}
+
+def run_load_test(floors=10, compact_per_floor=800, large_per_floor=150, handicapped_per_floor=50,
+                  operations=200_000, target_occupancy=0.85, handicapped_ratio=0.04, seed=7,
+                  compact_storage=False, policy="exact"):
+    rnd = random.Random(seed)
+    lot = ParkingLot(floors, compact_per_floor, large_per_floor, handicapped_per_floor,
+                     compact_storage=compact_storage, allocation_policy=ALLOCATION_POLICIES[policy]())
+    manager = ParkingManager(lot, NullLogger())
+    capacity = floors * (compact_per_floor + large_per_floor + handicapped_per_floor)
+    vehicle_types = [vehicle_type for vehicle_type, _ in VEHICLE_MIX]
+    weights = [weight for _, weight in VEHICLE_MIX]
+
+    parked = []
+    park_ns, unpark_ns = [], []
+    rejected = 0
+    clock = time.perf_counter_ns
+
+    start = time.perf_counter()
+    for i in range(operations):
+        # Arrivals outpace departures until the lot hovers around the target occupancy
+        if not parked or (len(parked) < target_occupancy * capacity and rnd.random() < 0.6):
+            vehicle = Vehicle(f"V{i}", rnd.choices(vehicle_types, weights)[0])
+            is_handicapped = rnd.random() < handicapped_ratio
+            t0 = clock()
+            ticket = manager.park_vehicle(vehicle, is_handicapped)
+            park_ns.append(clock() - t0)
+            if ticket:
+                parked.append(vehicle.get_vehicle_reg_num())
+            else:
+                rejected += 1
+        else:
+            # Depart a random car in O(1) by swapping it to the end of the list
+            index = rnd.randrange(len(parked))
+            parked[index], parked[-1] = parked[-1], parked[index]
+            reg_num = parked.pop()
+            t0 = clock()
+            manager.unpark_vehicle(reg_num)
+            unpark_ns.append(clock() - t0)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "config": {
+            "floors": floors,
+            "compact_per_floor": compact_per_floor,
+            "large_per_floor": large_per_floor,
+            "handicapped_per_floor": handicapped_per_floor,
+            "capacity": capacity,
+            "operations": operations,
+            "target_occupancy": target_occupancy,
+            "handicapped_ratio": handicapped_ratio,
+            "seed": seed,
+            "compact_storage": compact_storage,
+            "policy": policy,
+        },
+        "park": latency_summary(park_ns),
+        "unpark": latency_summary(unpark_ns),
+        "rejected_arrivals": rejected,
+        "final_occupancy": round(len(parked) / capacity, 4),
+        "total_s": round(elapsed, 4),
+        "ops_per_s": round(operations / elapsed),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def write_results(results, path):
+    results = dict(results, python=platform.python_version(), recorded_at=time.strftime("%Y-%m-%dT%H:%M:%S"))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+# ===========================
+# Unpark
+# ===========================
+
+def benchmark_unpark(total_spots=100_000, floors=10):
+    manager = ParkingManager(build_lot(total_spots, floors), NullLogger())
+    reg_nums = fill_lot(manager, total_spots)
+
+    start = time.perf_counter()
+    for reg_num in reg_nums:
+        manager.unpark_vehicle(reg_num)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "spots": total_spots,
+        "unparks": len(reg_nums),
+        "total_s": round(elapsed, 4),
+        "per_unpark_us": round(elapsed / len(reg_nums) * 1e6, 3),
+    }
+
+# ===========================
+# Storage
+# ===========================
+
+def benchmark_storage(total_spots=1_000_000, floors=100):
+    results = []
+    for compact_storage in (False, True):
+        tracemalloc.start()
+        start = time.perf_counter()
+        lot = build_lot(total_spots, floors, compact_storage=compact_storage)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results.append({
+            "compact_storage": compact_storage,
+            "spots": total_spots,
+            "build_s": round(elapsed, 4),
+            "peak_mb": round(peak / 2**20, 2),
+        })
+        del lot
+    return results
+
+# ===========================
+# Batch Replay
+# ===========================
+
+def benchmark_batch_replay(events=1_000_000, floors=100):
+    manager = ParkingManager(build_lot(events, floors, compact_storage=True), NullLogger())
+    vehicles = [Vehicle(f"CAR-{i}", VehicleType.CAR) for i in range(events)]
+
+    start = time.perf_counter()
+    tickets = manager.park_many(vehicles)
+    park_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = manager.unpark_many(vehicle.get_vehicle_reg_num() for vehicle in vehicles)
+    unpark_elapsed = time.perf_counter() - start
+
+    assert tickets.count(None) == 0 and all(results)
+    return {
+        "events": events,
+        "park_many_s": round(park_elapsed, 4),
+        "unpark_many_s": round(unpark_elapsed, 4),
+        "events_per_s": round(2 * events / (park_elapsed + unpark_elapsed)),
+    }
+
+# ===========================
+# Crash Recovery
+# ===========================
+
+def benchmark_recovery(cars=50_000, floors=10, snapshot_every=40_000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "lot")
+        journal = ParkingJournal(path, snapshot_every=snapshot_every, flush_every=1_000)
+        manager = ParkingManager(build_lot(cars, floors), NullLogger(), journal)
+        fill_lot(manager, cars)
+        # Simulate a crash: flush what was written but never close the journal cleanly
+        journal.flush()
+
+        lot = build_lot(cars, floors)
+        start = time.perf_counter()
+        recovered = ParkingManager(lot, NullLogger(), ParkingJournal(path))
+        elapsed = time.perf_counter() - start
+        recovered.journal.close()
+        journal.close()
+
+    assert len(recovered.active_tickets) == cars
+    return {"cars": cars, "snapshot_every": snapshot_every, "recover_s": round(elapsed, 4)}
+
+# ===========================
+# Concurrent Gates
+# ===========================
+
+def stress_test_concurrent_gates(gates=8, ops_per_gate=20_000, floors=10, spots_per_floor=500, seed=42):
+    lot = ParkingLot(floors, spots_per_floor, spots_per_floor // 5, spots_per_floor // 10)
+    manager = ConcurrentParkingManager(lot, NullLogger())
+    start_barrier = threading.Barrier(gates)
+    failures = []
+
+    def gate(gate_id):
+        rnd = random.Random(seed + gate_id)
+        parked = []
+        start_barrier.wait()
+        for i in range(ops_per_gate):
+            if parked and rnd.random() < 0.45:
+                reg_num = parked.pop(rnd.randrange(len(parked)))
+                if not manager.unpark_vehicle(reg_num):
+                    failures.append(f"unpark failed for {reg_num}")
+            else:
+                vehicle_type = rnd.choice((VehicleType.BIKE, VehicleType.CAR, VehicleType.CAR, VehicleType.TRUCK))
+                vehicle = Vehicle(f"G{gate_id}-{i}", vehicle_type)
+                if manager.park_vehicle(vehicle, rnd.random() < 0.05):
+                    parked.append(vehicle.get_vehicle_reg_num())
+
+    threads = [threading.Thread(target=gate, args=(gate_id,)) for gate_id in range(gates)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    # No spot may hold two vehicles and every active ticket must point at its own vehicle
+    occupied = {}
+    for floor in lot.parking_floors:
+        for spot in floor.get_parking_spots():
+            if not spot.is_available():
+                occupied[spot.get_spot_id()] = spot.get_vehicle().get_vehicle_reg_num()
+    ticketed = {ticket.spot_id: reg_num for reg_num, ticket in manager.active_tickets.items()}
+    if len(ticketed) != len(manager.active_tickets):
+        failures.append("two active tickets share a spot")
+    if occupied != ticketed:
+        failures.append("spot occupancy does not match active tickets")
+    assert not failures, failures
+
+    total_ops = gates * ops_per_gate
+    return {
+        "gates": gates,
+        "ops": total_ops,
+        "total_s": round(elapsed, 4),
+        "ops_per_s": round(total_ops / elapsed),
+        "active_tickets": len(manager.active_tickets),
+    }
+
+def stress_test_journaled_gates(gates=6, ops_per_gate=2_000, floors=2, spots_per_floor=3, runs=10, seed=42):
+    # A tiny lot keeps every spot contended, so a park journaled ahead of the unpark that freed
+    # its spot would make recovery drop that car; recovered tickets must match the live ones
+    mismatched_runs = 0
+    for run in range(runs):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "lot")
+            lot = ParkingLot(floors, spots_per_floor, 0, 0)
+            manager = ConcurrentParkingManager(lot, NullLogger(), ParkingJournal(path, snapshot_every=500))
+            start_barrier = threading.Barrier(gates)
+
+            def gate(gate_id):
+                rnd = random.Random(seed + run * gates + gate_id)
+                parked = []
+                start_barrier.wait()
+                for i in range(ops_per_gate):
+                    if parked and rnd.random() < 0.5:
+                        manager.unpark_vehicle(parked.pop(rnd.randrange(len(parked))))
+                    else:
+                        vehicle = Vehicle(f"G{gate_id}-{i}", rnd.choice((VehicleType.BIKE, VehicleType.CAR)))
+                        if manager.park_vehicle(vehicle):
+                            parked.append(vehicle.get_vehicle_reg_num())
+
+            threads = [threading.Thread(target=gate, args=(gate_id,)) for gate_id in range(gates)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            manager.journal.close()
+
+            recovered = ParkingManager(ParkingLot(floors, spots_per_floor, 0, 0), NullLogger(), ParkingJournal(path))
+            recovered.journal.close()
+            live = {reg_num: (t.floor, t.spot_id) for reg_num, t in manager.active_tickets.items()}
+            restored = {reg_num: (t.floor, t.spot_id) for reg_num, t in recovered.active_tickets.items()}
+            mismatched_runs += live != restored
+
+    assert not mismatched_runs, f"recovered tickets differed from live state in {mismatched_runs} of {runs} runs"
+    return {"gates": gates, "runs": runs, "ops_per_run": gates * ops_per_gate}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ParkingManager gate throughput and latency benchmark")
+    parser.add_argument("--floors", type=int, default=10)
+    parser.add_argument("--compact", type=int, default=800, help="compact spots per floor")
+    parser.add_argument("--large", type=int, default=150, help="large spots per floor")
+    parser.add_argument("--handicapped", type=int, default=50, help="handicapped spots per floor")
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--occupancy", type=float, default=0.85, help="target occupancy")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--compact-storage", action="store_true")
+    parser.add_argument("--policy", choices=sorted(ALLOCATION_POLICIES), default="exact")
+    parser.add_argument("--all", action="store_true", help="also run the unpark/storage/batch/recovery/concurrency benchmarks")
+    parser.add_argument("--output", default="parking_benchmark.json")
+    args = parser.parse_args()
+
+    results = {"load_test": run_load_test(args.floors, args.compact, args.large, args.handicapped, args.operations,
+                                          args.occupancy, seed=args.seed, compact_storage=args.compact_storage,
+                                          policy=args.policy)}
+    if args.all:
+        results["unpark"] = [benchmark_unpark(spots) for spots in (1_000, 10_000, 100_000)]
+        results["storage"] = benchmark_storage()
+        results["batch_replay"] = benchmark_batch_replay()
+        results["recovery"] = benchmark_recovery()
+        results["concurrent_gates"] = stress_test_concurrent_gates()
+        results["journaled_gates"] = stress_test_journaled_gates()
+
+    write_results(results, args.output)
+    print(json.dumps(results, indent=2))
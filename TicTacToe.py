@@ -1,3 +1,10 @@
+import asyncio
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
 class Player:
     def __init__(self, id, name, symbol):
         self.id = id
@@ -18,14 +25,56 @@ class Board:
     def __init__(self, size):
         self.size = size
         self.board = [[' '] * self.size for _ in range(self.size)]
+        # Per-symbol mark counts for every row, column and both diagonals
+        self.row_counts = {}
+        self.col_counts = {}
+        self.diag_counts = {}
+        self.anti_diag_counts = {}
+        self.winner = None
 
     def make_move(self, r, c, player):
+        # Negative indices would write a real cell through list wrap-around, but the diagonal
+        # counters need the true row and column, so only in-range cells are accepted
+        if not (0 <= r < self.size and 0 <= c < self.size):
+            raise IndexError(f"cell ({r}, {c}) is off the {self.size}x{self.size} board")
         if self.board[r][c] != ' ':
             return False
-        self.board[r][c] = player.get_symbol()
+        symbol = player.get_symbol()
+        self.board[r][c] = symbol
+        self._count_move(r, c, symbol)
         return True
 
+    def _count_move(self, r, c, symbol):
+        if symbol not in self.row_counts:
+            self.row_counts[symbol] = [0] * self.size
+            self.col_counts[symbol] = [0] * self.size
+            self.diag_counts[symbol] = 0
+            self.anti_diag_counts[symbol] = 0
+
+        rows, cols = self.row_counts[symbol], self.col_counts[symbol]
+        rows[r] += 1
+        cols[c] += 1
+        won = rows[r] == self.size or cols[c] == self.size
+        if r == c:
+            self.diag_counts[symbol] += 1
+            won = won or self.diag_counts[symbol] == self.size
+        if r + c == self.size - 1:
+            self.anti_diag_counts[symbol] += 1
+            won = won or self.anti_diag_counts[symbol] == self.size
+        if won and self.winner is None:
+            self.winner = symbol
+
     def check_winner(self):
+        return self.winner
+
+    def get_symbol(self, r, c):
+        return self.board[r][c]
+
+    def get_cell_count(self):
+        return self.size * self.size
+
+    def scan_winner(self):
+        # Full O(n^2) rescan; kept as a reference for check_winner
         # Check Rows
         for i in range(self.size):
             if all(self.board[i][j] == self.board[i][0] and self.board[i][0] != ' ' for j in range(self.size)):
@@ -47,20 +96,419 @@ class Board:
         return None
 
 
+class BitBoard:
+    # Each symbol's marks are one int, bit r * size + c set per cell
+    __slots__ = ("size", "masks", "occupied", "winner")
+
+    # size -> per-cell tuple of the win-line masks passing through that cell
+    _cell_lines = {}
+
+    def __init__(self, size):
+        self.size = size
+        self.masks = {}
+        self.occupied = 0
+        self.winner = None
+        self.get_cell_lines(size)
+
+    @classmethod
+    def get_cell_lines(cls, size):
+        if size not in cls._cell_lines:
+            cls._cell_lines[size] = cls._build_cell_lines(size)
+        return cls._cell_lines[size]
+
+    @staticmethod
+    def _build_cell_lines(size):
+        rows = [sum(1 << (r * size + c) for c in range(size)) for r in range(size)]
+        cols = [sum(1 << (r * size + c) for r in range(size)) for c in range(size)]
+        diag = sum(1 << (i * size + i) for i in range(size))
+        anti_diag = sum(1 << (i * size + size - 1 - i) for i in range(size))
+
+        cell_lines = []
+        for r in range(size):
+            for c in range(size):
+                lines = [rows[r], cols[c]]
+                if r == c:
+                    lines.append(diag)
+                if r + c == size - 1:
+                    lines.append(anti_diag)
+                cell_lines.append(tuple(lines))
+        return cell_lines
+
+    def make_move(self, r, c, player):
+        # Check before touching any state: (0, size) would otherwise alias the next row's
+        # first cell and an index past the end would set a bit with no win lines
+        if not (0 <= r < self.size and 0 <= c < self.size):
+            raise IndexError(f"cell ({r}, {c}) is off the {self.size}x{self.size} board")
+        bit = 1 << (r * self.size + c)
+        if self.occupied & bit:
+            return False
+        symbol = player.get_symbol()
+        mask = self.masks.get(symbol, 0) | bit
+        self.masks[symbol] = mask
+        self.occupied |= bit
+
+        if self.winner is None:
+            for line in BitBoard._cell_lines[self.size][r * self.size + c]:
+                if mask & line == line:
+                    self.winner = symbol
+                    break
+        return True
+
+    def check_winner(self):
+        return self.winner
+
+    def get_cell_count(self):
+        return self.size * self.size
+
+    def get_symbol(self, r, c):
+        bit = 1 << (r * self.size + c)
+        for symbol, mask in self.masks.items():
+            if mask & bit:
+                return symbol
+        return ' '
+
+
+class MNKBoard:
+    # rows x cols board where k in a row in any direction wins (e.g. Gomoku is 15x15, k=5).
+    # A move only walks the four lines through the placed cell, at most k-1 cells each way.
+    # Like BitBoard it only shares Board's playing interface; Board's line counters assume
+    # a square board won by a full line, which doesn't hold here.
+    DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+    def __init__(self, rows, cols, k):
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.board = [[' '] * cols for _ in range(rows)]
+        self.winner = None
+
+    def make_move(self, r, c, player):
+        # _wins_at walks from the true cell, so negative indices can't be allowed to wrap
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError(f"cell ({r}, {c}) is off the {self.rows}x{self.cols} board")
+        if self.board[r][c] != ' ':
+            return False
+        symbol = player.get_symbol()
+        self.board[r][c] = symbol
+        if self.winner is None and self._wins_at(r, c, symbol):
+            self.winner = symbol
+        return True
+
+    def _wins_at(self, r, c, symbol):
+        for dr, dc in self.DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                rr, cc = r + sign * dr, c + sign * dc
+                while count < self.k and 0 <= rr < self.rows and 0 <= cc < self.cols and self.board[rr][cc] == symbol:
+                    count += 1
+                    rr += sign * dr
+                    cc += sign * dc
+            if count >= self.k:
+                return True
+        return False
+
+    def check_winner(self):
+        return self.winner
+
+    def get_symbol(self, r, c):
+        return self.board[r][c]
+
+    def get_cell_count(self):
+        return self.rows * self.cols
+
+    def scan_winner(self):
+        # Full-board rescan for reference; O(rows * cols * k)
+        for r in range(self.rows):
+            for c in range(self.cols):
+                symbol = self.board[r][c]
+                if symbol == ' ':
+                    continue
+                for dr, dc in self.DIRECTIONS:
+                    end_r, end_c = r + (self.k - 1) * dr, c + (self.k - 1) * dc
+                    if not (0 <= end_r < self.rows and 0 <= end_c < self.cols):
+                        continue
+                    if all(self.board[r + i * dr][c + i * dc] == symbol for i in range(1, self.k)):
+                        return symbol
+        return None
+
+
+class AIPlayer(Player):
+    # Negamax with alpha-beta pruning over bitmasks, a symmetry-aware transposition table
+    # and iterative deepening under a time budget. Works on square boards where a full
+    # row, column or diagonal wins.
+
+    WIN = 1_000_000
+    EXACT, LOWER, UPPER = 0, 1, 2
+    CHECK_EVERY = 1024
+
+    def __init__(self, id, name, symbol, time_budget=1.0, max_depth=None, max_table_size=1_000_000):
+        super().__init__(id, name, symbol)
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.max_table_size = max_table_size
+        # Two generations approximate LRU: when the young table fills it becomes the old one
+        self.table = {}
+        self.old_table = {}
+        self.last_search_stats = {}
+        self._size = None
+
+    # size -> board geometry shared by every AIPlayer: move order, line masks and the
+    # symmetry lookup tables, which take seconds to build on large boards
+    _geometry = {}
+
+    @classmethod
+    def get_geometry(cls, size):
+        if size not in cls._geometry:
+            cls._geometry[size] = cls._build_geometry(size)
+        return cls._geometry[size]
+
+    @staticmethod
+    def _build_geometry(size):
+        cells = size * size
+        cell_lines = BitBoard.get_cell_lines(size)
+        lines = list({line for lines in cell_lines for line in lines})
+        # Centre-first move order
+        center = (size - 1) / 2
+        move_order = sorted(range(cells), key=lambda i: abs(i // size - center) + abs(i % size - center))
+        weights = [0] + [4 ** k for k in range(1, size + 1)]
+
+        # The 8 symmetries of the square as cell permutations, plus per-row lookup tables so
+        # a mask is transformed with one lookup per row instead of one per cell
+        transforms = [
+            lambda r, c: (r, c), lambda r, c: (c, size - 1 - r),
+            lambda r, c: (size - 1 - r, size - 1 - c), lambda r, c: (size - 1 - c, r),
+            lambda r, c: (r, size - 1 - c), lambda r, c: (size - 1 - r, c),
+            lambda r, c: (c, r), lambda r, c: (size - 1 - c, size - 1 - r),
+        ]
+        perms = []
+        row_tables = []
+        for transform in transforms:
+            perm = [0] * cells
+            for i in range(cells):
+                r, c = transform(i // size, i % size)
+                perm[i] = r * size + c
+            inverse = [0] * cells
+            for i, j in enumerate(perm):
+                inverse[j] = i
+            perms.append((perm, inverse))
+            tables = []
+            for r in range(size):
+                table = [0] * (1 << size)
+                for bits in range(1 << size):
+                    mask = 0
+                    for c in range(size):
+                        if bits >> c & 1:
+                            mask |= 1 << perm[r * size + c]
+                    table[bits] = mask
+                tables.append(table)
+            row_tables.append(tables)
+        return cell_lines, lines, (1 << cells) - 1, move_order, weights, perms, row_tables
+
+    def _prepare(self, size):
+        if self._size == size:
+            return
+        self._size = size
+        self.table, self.old_table = {}, {}
+        (self._cell_lines, self._lines, self._full, self._move_order, self._weights,
+         self._perms, self._row_tables) = self.get_geometry(size)
+
+    def _canonical(self, me, opp):
+        size = self._size
+        row_mask = (1 << size) - 1
+        cells = size * size
+        best_key, best_t = None, 0
+        for t, tables in enumerate(self._row_tables):
+            tm = to = 0
+            for r in range(size):
+                shift = r * size
+                tm |= tables[r][(me >> shift) & row_mask]
+                to |= tables[r][(opp >> shift) & row_mask]
+            key = (tm << cells) | to
+            if best_key is None or key < best_key:
+                best_key, best_t = key, t
+        return best_key, best_t
+
+    def _probe(self, key):
+        self._probes += 1
+        entry = self.table.get(key)
+        if entry is None:
+            entry = self.old_table.get(key)
+            if entry is not None:
+                self._store(key, entry)
+        if entry is not None:
+            self._hits += 1
+        return entry
+
+    def _store(self, key, entry):
+        if len(self.table) >= self.max_table_size // 2:
+            self.old_table = self.table
+            self.table = {}
+        self.table[key] = entry
+
+    def _evaluate(self, me, opp):
+        score = 0
+        weights = self._weights
+        for line in self._lines:
+            if not line & opp:
+                score += weights[(line & me).bit_count()]
+            elif not line & me:
+                score -= weights[(line & opp).bit_count()]
+        return score
+
+    def _negamax(self, me, opp, depth, alpha, beta):
+        self._nodes += 1
+        if self._nodes % self.CHECK_EVERY == 0 and time.perf_counter() > self._deadline:
+            raise TimeoutError
+
+        empty = self._full & ~(me | opp)
+        if not empty:
+            return 0
+        if depth == 0:
+            return self._evaluate(me, opp)
+
+        alpha_orig = alpha
+        key, t = self._canonical(me, opp)
+        entry = self._probe(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, value, flag, canon_move = entry
+            if entry_depth >= depth:
+                if flag == self.EXACT:
+                    return value
+                if flag == self.LOWER:
+                    alpha = max(alpha, value)
+                elif flag == self.UPPER:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+            tt_move = self._perms[t][1][canon_move]
+
+        best_value, best_move = -self.WIN * 2, None
+        for move in self._ordered_moves(empty, tt_move):
+            bit = 1 << move
+            mine = me | bit
+            if any(mine & line == line for line in self._cell_lines[move]):
+                value = self.WIN - 1
+            else:
+                value = -self._negamax(opp, mine, depth - 1, -beta - 1, -alpha + 1)
+                # Scores are relative to this position: a win found deeper is worth less
+                if value > self.WIN // 2:
+                    value -= 1
+                elif value < -self.WIN // 2:
+                    value += 1
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= alpha_orig:
+            flag = self.UPPER
+        elif best_value >= beta:
+            flag = self.LOWER
+        else:
+            flag = self.EXACT
+        self._store(key, (depth, best_value, flag, self._perms[t][0][best_move]))
+        return best_value
+
+    def _ordered_moves(self, empty, first=None):
+        if first is not None and empty >> first & 1:
+            yield first
+        for move in self._move_order:
+            if move != first and empty >> move & 1:
+                yield move
+
+    def choose_move(self, board, opponent_symbol):
+        if isinstance(board, MNKBoard):
+            raise ValueError("AIPlayer searches square boards won by a full line, not m,n,k boards")
+        # The clock starts before _prepare: building the tables for a new board size counts
+        # against the time budget
+        start = time.perf_counter()
+        self._deadline = start + self.time_budget
+        size = board.size
+        self._prepare(size)
+        me = opp = 0
+        for r in range(size):
+            for c in range(size):
+                symbol = board.get_symbol(r, c)
+                if symbol == self.symbol:
+                    me |= 1 << (r * size + c)
+                elif symbol == opponent_symbol:
+                    opp |= 1 << (r * size + c)
+
+        empty = self._full & ~(me | opp)
+        if not empty:
+            return None
+        self._nodes = self._probes = self._hits = 0
+        max_depth = min(self.max_depth or empty.bit_count(), empty.bit_count())
+
+        best_move, best_value, completed_depth = next(self._ordered_moves(empty)), None, 0
+        for depth in range(1, max_depth + 1):
+            try:
+                move, value = self._search_root(me, opp, empty, depth, best_move)
+            except TimeoutError:
+                break
+            best_move, best_value, completed_depth = move, value, depth
+            if abs(value) > self.WIN // 2:
+                break  # forced result found
+
+        elapsed = time.perf_counter() - start
+        self.last_search_stats = {
+            "depth": completed_depth,
+            "value": best_value,
+            "nodes": self._nodes,
+            "seconds": round(elapsed, 4),
+            "nodes_per_sec": round(self._nodes / elapsed) if elapsed else None,
+            "table_probes": self._probes,
+            "table_hit_rate": round(self._hits / self._probes, 4) if self._probes else 0.0,
+            "table_size": len(self.table) + len(self.old_table),
+        }
+        return divmod(best_move, size)
+
+    def _search_root(self, me, opp, empty, depth, first):
+        alpha, beta = -self.WIN * 2, self.WIN * 2
+        best_move, best_value = None, -self.WIN * 2
+        for move in self._ordered_moves(empty, first):
+            bit = 1 << move
+            mine = me | bit
+            if any(mine & line == line for line in self._cell_lines[move]):
+                return move, self.WIN - 1
+            value = -self._negamax(opp, mine, depth - 1, -beta, -alpha)
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+        return best_move, best_value
+
+
 class TicTacToe:
-    def __init__(self, players, board_size=3):
+    __slots__ = ("players", "board", "curr_move", "move_count")
+
+    def __init__(self, players, board_size=3, board=None):
         self.players = players
-        self.board = Board(board_size)
+        self.board = board if board is not None else Board(board_size)
         self.curr_move = 0  # 0: player_1, 1: player_2
+        self.move_count = 0
 
     def make_move(self, r, c):
         curr_player = self.players[self.curr_move]
         if self.board.make_move(r, c, curr_player):
             # Switch player turn
             self.curr_move = 1 - self.curr_move
+            self.move_count += 1
             return True
         return False
 
+    def is_over(self):
+        return self.board.check_winner() is not None or self.move_count == self.board.get_cell_count()
+
+    def play_turn(self):
+        # Lets the current player choose its own move; requires a player with choose_move
+        curr_player = self.players[self.curr_move]
+        opponent = self.players[1 - self.curr_move]
+        r, c = curr_player.choose_move(self.board, opponent.get_symbol())
+        self.make_move(r, c)
+        return r, c
+
     def play(self, moves):
         for r, c in moves:
             if not self.make_move(r, c):
@@ -82,19 +530,191 @@ class TicTacToe:
         return 'No Winner Yet'
 
 
-player1 = Player(1, "Alice", 'X')
-player2 = Player(2, "Bob", 'O')
+class GameServer:
+    # Hosts many concurrent games on one asyncio loop. Moves arrive through an asyncio.Queue
+    # (submit) or a line protocol over a local socket (serve):
+    #   NEW             -> <game_id>
+    #   MOVE id r c     -> OK | INVALID | WIN <symbol> | DRAW | UNKNOWN
+    # Every game shares the same two Player objects and runs on a BitBoard, so a live game
+    # costs one TicTacToe and one BitBoard. Finished games are dropped.
+
+    def __init__(self, board_size=3):
+        self.board_size = board_size
+        self.players = [Player(1, "Player 1", 'X'), Player(2, "Player 2", 'O')]
+        self.games = {}
+        self.moves_applied = 0
+        self._next_id = 0
+        self._queue = asyncio.Queue()
+
+    def new_game(self):
+        game_id = self._next_id
+        self._next_id += 1
+        self.games[game_id] = TicTacToe(self.players, board=BitBoard(self.board_size))
+        return game_id
+
+    def apply_move(self, game_id, r, c):
+        game = self.games.get(game_id)
+        if game is None:
+            return "UNKNOWN"
+        if not (0 <= r < self.board_size and 0 <= c < self.board_size) or not game.make_move(r, c):
+            return "INVALID"
+        self.moves_applied += 1
+        winner = game.board.check_winner()
+        if winner is not None:
+            del self.games[game_id]
+            return f"WIN {winner}"
+        if game.move_count == game.board.get_cell_count():
+            del self.games[game_id]
+            return "DRAW"
+        return "OK"
+
+    async def submit(self, game_id, r, c):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((game_id, r, c, future))
+        return await future
+
+    async def run(self):
+        # Single consumer: drains whatever is queued per wake-up, so games never need locks.
+        # A submitter may have been cancelled while its move was queued; the move still
+        # applies, but its future is already done and must not be resolved again.
+        while True:
+            game_id, r, c, future = await self._queue.get()
+            reply = self.apply_move(game_id, r, c)
+            if not future.done():
+                future.set_result(reply)
+            while not self._queue.empty():
+                game_id, r, c, future = self._queue.get_nowait()
+                reply = self.apply_move(game_id, r, c)
+                if not future.done():
+                    future.set_result(reply)
+
+    async def serve(self, host="127.0.0.1", port=0):
+        return await asyncio.start_server(self._handle_client, host, port)
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                parts = line.split()
+                if parts == [b"NEW"]:
+                    reply = str(self.new_game())
+                elif len(parts) == 4 and parts[0] == b"MOVE":
+                    try:
+                        reply = self.apply_move(int(parts[1]), int(parts[2]), int(parts[3]))
+                    except ValueError:
+                        reply = "ERROR"
+                else:
+                    reply = "ERROR"
+                writer.write(reply.encode() + b"\n")
+                # Only wait on the socket when its buffer backs up
+                if writer.transport.get_write_buffer_size() > 64 * 1024:
+                    await writer.drain()
+        finally:
+            writer.close()
+
+
+PLAYER_KINDS = ("random", "ai")
+
+def _simulate_batch(board_size, player_kinds, first_game, games, seed, ai_max_depth):
+    # Runs in a worker process; plays quietly and returns only the tallies
+    players = [
+        AIPlayer(i + 1, f"AI {i + 1}", symbol, time_budget=float("inf"), max_depth=ai_max_depth) if kind == "ai"
+        else Player(i + 1, f"Random {i + 1}", symbol)
+        for i, (kind, symbol) in enumerate(zip(player_kinds, ('X', 'O')))
+    ]
+    ai_players = [player for player in players if isinstance(player, AIPlayer)]
+    cells = [(r, c) for r in range(board_size) for c in range(board_size)]
+    tally = {"player_1_wins": 0, "player_2_wins": 0, "draws": 0}
+
+    for game_num in range(first_game, first_game + games):
+        # Each game gets its own RNG and fresh transposition tables, so its outcome doesn't
+        # depend on which batch it landed in
+        rnd = random.Random((seed << 32) + game_num)
+        for player in ai_players:
+            player.table, player.old_table = {}, {}
+        game = TicTacToe(players, board=BitBoard(board_size))
+        # Random players take the next cell of a shuffled order, which is a uniform choice
+        # among the cells still free
+        order = cells[:]
+        rnd.shuffle(order)
+        taken = set()
+        while not game.is_over():
+            player = players[game.curr_move]
+            if isinstance(player, AIPlayer):
+                move = player.choose_move(game.board, players[1 - game.curr_move].get_symbol())
+            else:
+                move = order.pop()
+                while move in taken:
+                    move = order.pop()
+            taken.add(move)
+            game.make_move(*move)
+
+        winner = game.board.check_winner()
+        if winner == 'X':
+            tally["player_1_wins"] += 1
+        elif winner == 'O':
+            tally["player_2_wins"] += 1
+        else:
+            tally["draws"] += 1
+    return tally
+
+
+def simulate_games(num_games, board_size=3, player_kinds=("random", "random"), processes=None, seed=0,
+                   ai_max_depth=4, batches_per_process=4):
+    # Splits the games into batches spread over a process pool. Tallies depend only on the
+    # seed: every game is seeded by its index and AI players search to a fixed depth with no
+    # time limit, so neither machine load nor worker count changes the result.
+    player_kinds = tuple(player_kinds)
+    if len(player_kinds) != 2 or any(kind not in PLAYER_KINDS for kind in player_kinds):
+        raise ValueError(f"player_kinds must be two of {PLAYER_KINDS}, got {player_kinds!r}")
+    processes = processes or os.cpu_count() or 1
+    batch_count = max(1, min(num_games, processes * batches_per_process))
+    sizes = [num_games // batch_count + (i < num_games % batch_count) for i in range(batch_count)]
+    starts = [sum(sizes[:i]) for i in range(batch_count)]
+    args = [(board_size, player_kinds, start, size, seed, ai_max_depth) for start, size in zip(starts, sizes)]
+
+    if processes == 1:
+        tallies = [_simulate_batch(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            tallies = list(pool.map(_simulate_batch, *zip(*args)))
+
+    stats = {"games": num_games, "player_1_wins": 0, "player_2_wins": 0, "draws": 0}
+    for tally in tallies:
+        for key, count in tally.items():
+            stats[key] += count
+    return stats
+
+
+if __name__ == "__main__":
+    player1 = Player(1, "Alice", 'X')
+    player2 = Player(2, "Bob", 'O')
+
+    game = TicTacToe([player1, player2], 3)
+    moves = [
+        (0, 0),  # Player 1 (X) moves
+        (0, 1),  # Player 2 (O) moves
+        (1, 1),  # Player 1 (X) moves
+        (2, 2),  # Player 2 (O) moves
+        (2, 1),  # Player 1 (X) moves
+        (1, 0),  # Player 2 (O) moves
+        (1, 2),  # Player 1 (X) moves
+    ]
+
+    game.play(moves)
+    print(game.check_winner())
+
+    bit_game = TicTacToe([player1, player2], board=BitBoard(3))
+    bit_game.play(moves)
+    print(bit_game.check_winner())
+
+    ai_game = TicTacToe([AIPlayer(3, "Deep", 'X', time_budget=0.5), AIPlayer(4, "Blue", 'O', time_budget=0.5)],
+                        board=BitBoard(3))
+    while not ai_game.is_over():
+        ai_game.play_turn()
+    print(ai_game.check_winner())
+    print(ai_game.players[0].last_search_stats)
 
-game = TicTacToe([player1, player2], 3)
-moves = [
-    (0, 0),  # Player 1 (X) moves
-    (0, 1),  # Player 2 (O) moves
-    (1, 1),  # Player 1 (X) moves
-    (2, 2),  # Player 2 (O) moves
-    (2, 1),  # Player 1 (X) moves
-    (1, 0),  # Player 2 (O) moves
-    (1, 2),  # Player 1 (X) moves
-]
+    gomoku = TicTacToe([player1, player2], board=MNKBoard(15, 15, 5))
+    gomoku.play([(7, 7), (0, 0), (8, 8), (0, 1), (6, 6), (0, 2), (9, 9), (0, 3), (5, 5)])
 
-game.play(moves)
-print(game.check_winner())
\ No newline at end of file
+    print(simulate_games(10_000, seed=1))
\ No newline at end of file
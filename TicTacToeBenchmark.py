@@ -0,0 +1,230 @@
+import asyncio
+import os
+import random
+import time
+import tracemalloc
+
+from TicTacToe import AIPlayer, BitBoard, Board, GameServer, MNKBoard, Player, simulate_games
+
+# ===========================
+# Helpers
+# ===========================
+
+def random_moves(size, seed):
+    moves = [(r, c) for r in range(size) for c in range(size)]
+    random.Random(seed).shuffle(moves)
+    return moves
+
+def players():
+    return [Player(1, "Alice", 'X'), Player(2, "Bob", 'O')]
+
+# ===========================
+# Win Detection
+# ===========================
+
+def benchmark_win_detection(sizes=(3, 15, 100), max_moves=2_000, seed=1):
+    results = []
+    for size in sizes:
+        moves = random_moves(size, seed)[:max_moves]
+        timings = {}
+        for method in ("check_winner", "scan_winner"):
+            board = Board(size)
+            both = players()
+            start = time.perf_counter()
+            for i, (r, c) in enumerate(moves):
+                board.make_move(r, c, both[i % 2])
+                getattr(board, method)()
+            timings[method] = time.perf_counter() - start
+        results.append({
+            "size": size,
+            "moves": len(moves),
+            "incremental_us_per_move": round(timings["check_winner"] / len(moves) * 1e6, 3),
+            "scan_us_per_move": round(timings["scan_winner"] / len(moves) * 1e6, 3),
+            "speedup": round(timings["scan_winner"] / timings["check_winner"], 1),
+        })
+    return results
+
+# ===========================
+# Board Backends
+# ===========================
+
+def benchmark_backends(size=3, games=20_000, boards=10_000, seed=2):
+    results = []
+    game_moves = [random_moves(size, seed + i) for i in range(min(games, 1_000))]
+    for board_cls in (Board, BitBoard):
+        both = players()
+        start = time.perf_counter()
+        total_moves = 0
+        for i in range(games):
+            board = board_cls(size)
+            for j, (r, c) in enumerate(game_moves[i % len(game_moves)]):
+                board.make_move(r, c, both[j % 2])
+                total_moves += 1
+                if board.check_winner():
+                    break
+        elapsed = time.perf_counter() - start
+
+        # Memory of a half-played board, as held by a self-play worker
+        tracemalloc.start()
+        held = []
+        for i in range(boards):
+            board = board_cls(size)
+            for j, (r, c) in enumerate(game_moves[i % len(game_moves)][:size * size // 2]):
+                board.make_move(r, c, both[j % 2])
+            held.append(board)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results.append({
+            "backend": board_cls.__name__,
+            "size": size,
+            "games_per_s": round(games / elapsed),
+            "us_per_move": round(elapsed / total_moves * 1e6, 3),
+            "bytes_per_board": round(current / boards),
+        })
+    return results
+
+# ===========================
+# m,n,k Boards
+# ===========================
+
+def benchmark_mnk(rows=19, cols=19, k=5, games=200, scan_games=5, seed=3):
+    both = players()
+    results = {"rows": rows, "cols": cols, "k": k}
+    for method, count in (("check_winner", games), ("scan_winner", scan_games)):
+        total_moves = 0
+        start = time.perf_counter()
+        for g in range(count):
+            board = MNKBoard(rows, cols, k)
+            moves = [(r, c) for r in range(rows) for c in range(cols)]
+            random.Random(seed + g).shuffle(moves)
+            for i, (r, c) in enumerate(moves):
+                board.make_move(r, c, both[i % 2])
+                total_moves += 1
+                if getattr(board, method)():
+                    break
+        elapsed = time.perf_counter() - start
+        results[f"{method}_us_per_move"] = round(elapsed / total_moves * 1e6, 3)
+    results["speedup"] = round(results["scan_winner_us_per_move"] / results["check_winner_us_per_move"], 1)
+    return results
+
+# ===========================
+# Game Server
+# ===========================
+
+async def _play_via_queue(server, game_id, moves):
+    played = 0
+    for r, c in moves:
+        reply = await server.submit(game_id, r, c)
+        played += 1
+        if reply != "OK":
+            break
+    return played
+
+async def _play_via_socket(port, games, size, seed):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"NEW\n" * games)
+    game_ids = [int(await reader.readline()) for _ in range(games)]
+    pending = {game_id: random_moves(size, seed + game_id) for game_id in game_ids}
+    played = 0
+    for turn in range(size * size):
+        live = list(pending)
+        if not live:
+            break
+        # Pipeline one move for every live game, then read the replies in order
+        writer.write(b"".join(b"MOVE %d %d %d\n" % (game_id, *pending[game_id][turn]) for game_id in live))
+        for game_id in live:
+            played += 1
+            if (await reader.readline()).strip() != b"OK":
+                del pending[game_id]
+    writer.close()
+    await writer.wait_closed()
+    return played
+
+async def _server_load_test(live_games, size, connections, seed):
+    server = GameServer(size)
+    consumer = asyncio.create_task(server.run())
+
+    tracemalloc.start()
+    game_ids = [server.new_game() for _ in range(live_games)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    played = await asyncio.gather(*(
+        _play_via_queue(server, game_id, random_moves(size, seed + game_id)) for game_id in game_ids
+    ))
+    queue_elapsed = time.perf_counter() - start
+
+    listener = await server.serve()
+    port = listener.sockets[0].getsockname()[1]
+    start = time.perf_counter()
+    socket_played = await asyncio.gather(*(
+        _play_via_socket(port, live_games // connections, size, seed) for _ in range(connections)
+    ))
+    socket_elapsed = time.perf_counter() - start
+    listener.close()
+    await listener.wait_closed()
+    consumer.cancel()
+
+    return {
+        "live_games": live_games,
+        "size": size,
+        "bytes_per_game": round(current / live_games),
+        "queue_moves": sum(played),
+        "queue_moves_per_s": round(sum(played) / queue_elapsed),
+        "socket_connections": connections,
+        "socket_moves": sum(socket_played),
+        "socket_moves_per_s": round(sum(socket_played) / socket_elapsed),
+    }
+
+def benchmark_server(live_games=10_000, size=3, connections=50, seed=4):
+    return asyncio.run(_server_load_test(live_games, size, connections, seed))
+
+# ===========================
+# Self-Play Simulation
+# ===========================
+
+def benchmark_simulation(num_games=200_000, max_processes=None, seed=5):
+    max_processes = max_processes or os.cpu_count() or 1
+    results = []
+    baseline = None
+    for processes in sorted({1, *range(2, max_processes + 1, 2), max_processes}):
+        start = time.perf_counter()
+        stats = simulate_games(num_games, processes=processes, seed=seed)
+        elapsed = time.perf_counter() - start
+        games_per_s = num_games / elapsed
+        baseline = baseline or games_per_s
+        results.append({
+            "processes": processes,
+            "games_per_s": round(games_per_s),
+            "speedup": round(games_per_s / baseline, 2),
+            "efficiency": round(games_per_s / baseline / processes, 2),
+            "stats": stats,
+        })
+    return results
+
+# ===========================
+# AI Search
+# ===========================
+
+def benchmark_ai(sizes=(3, 4, 5), time_budget=2.0):
+    results = []
+    for size in sizes:
+        ai = AIPlayer(1, "AI", 'X', time_budget=time_budget)
+        move = ai.choose_move(BitBoard(size), 'O')
+        results.append(dict(size=size, move=move, **ai.last_search_stats))
+    return results
+
+if __name__ == "__main__":
+    for result in benchmark_win_detection():
+        print(result)
+    for size in (3, 15):
+        for result in benchmark_backends(size, games=20_000 if size == 3 else 2_000):
+            print(result)
+    print(benchmark_mnk())
+    print(benchmark_server())
+    for result in benchmark_simulation():
+        print(result)
+    for result in benchmark_ai():
+        print(result)